@@ -9,16 +9,16 @@ import pandas as pd
 import plotly.express as px
 import os
 import sys
+import zlib
 from pathlib import Path
-import tempfile
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from algorithms.graph_builder import build_graph_from_transactions
+from utils.cache import load_or_build
+from utils.data_loader import load_supermarket_data
 from analysis.frequent_items import (
     find_items_bought_with,
-    get_top_bundles,
     get_frequent_pairs,
 )
 
@@ -29,59 +29,73 @@ try:
 except ImportError:
     PYVIS_AVAILABLE = False
 
+try:
+    import orjson
 
-# Page configuration
-st.set_page_config(page_title="Market Basket Analysis", layout="wide")
+    def json_dumps(obj):
+        """Serialize to a JSON string using orjson."""
+        return orjson.dumps(obj).decode("utf-8")
 
+except ImportError:
+    from json import dumps as json_dumps
 
-@st.cache_data
-def load_supermarket_data(max_transactions=None):
-    """Load and cache the supermarket dataset."""
-    import csv
-    from collections import defaultdict
 
-    filepath = "data/raw/Supermarket_dataset_PAI.csv"
+# Networks larger than this skip vis-network's expensive improved layout
+LARGE_NETWORK_NODES = 500
 
-    if not os.path.exists(filepath):
-        st.error(f"Dataset not found at {filepath}")
-        return None
+# Above this many edges, edges are drawn straight instead of curved and
+# nodes are hidden while the view is dragged
+SMOOTH_EDGE_LIMIT = 80
+
+# Page configuration
+st.set_page_config(page_title="Market Basket Analysis", layout="wide")
 
-    transactions_dict = defaultdict(list)
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            member = row["Member_number"]
-            date = row["Date"]
-            item = row["itemDescription"].strip().lower()
+DATA_PATH = "data/raw/Supermarket_dataset_PAI.csv"
 
-            if item:
-                transaction_key = f"{member}_{date}"
-                transactions_dict[transaction_key].append(item)
 
-    transactions = list(transactions_dict.values())
-    transactions = [[*dict.fromkeys(txn)] for txn in transactions]
+@st.cache_resource
+def load_dataset(max_transactions=None):
+    """
+    Load transactions and graph, reusing the on-disk cache across runs.
 
-    if max_transactions:
-        transactions = transactions[:max_transactions]
+    The app only queries the graph, so it keeps the compact frozen
+    snapshot and lets the mutable dict-of-dicts graph be freed.
+    """
+    if not os.path.exists(DATA_PATH):
+        st.error(f"Dataset not found at {DATA_PATH}")
+        return None, None
 
-    return transactions
+    transactions, graph = load_or_build(
+        DATA_PATH, load_supermarket_data, max_transactions, already_normalized=True
+    )
+    return transactions, graph.freeze()
 
 
 @st.cache_data
-def build_graph_cached(transactions):
-    """Build and cache the graph."""
-    return build_graph_from_transactions(transactions)
+def get_sorted_edges(max_transactions, _graph):
+    """
+    Get all item pairs sorted by frequency (descending), once per dataset.
 
+    The graph argument is not hashed by Streamlit (leading underscore);
+    max_transactions identifies which cached graph it is.
+    """
+    return get_frequent_pairs(_graph, min_frequency=1)
 
-def create_pyvis_network(graph, max_edges=50, physics_enabled=True):
-    """Create interactive network using PyVis with improved edge visibility."""
+
+def create_pyvis_network(graph, all_sorted_edges, max_edges=50, physics_enabled=False):
+    """
+    Create interactive network using PyVis with improved edge visibility.
+
+    Physics is off by default: the browser-side simulation is the dominant
+    rendering cost. Large networks also drop curved edges and vis-network's
+    improved initial layout, both of which scale poorly.
+    """
     if not PYVIS_AVAILABLE:
         return None
 
-    # Get top edges
-    all_edges = get_frequent_pairs(graph, min_frequency=1)
-    sorted_edges = sorted(all_edges, key=lambda x: x[2], reverse=True)[:max_edges]
+    # Get top edges (input is already sorted by frequency)
+    sorted_edges = all_sorted_edges[:max_edges]
 
     if not sorted_edges:
         return None
@@ -95,8 +109,8 @@ def create_pyvis_network(graph, max_edges=50, physics_enabled=True):
     )
 
     # Add nodes and edges
-    added_nodes = set()
     max_weight = sorted_edges[0][2] if sorted_edges else 1
+    smooth_edges = len(sorted_edges) <= SMOOTH_EDGE_LIMIT
 
     # Color palette for nodes
     node_colors = [
@@ -110,101 +124,110 @@ def create_pyvis_network(graph, max_edges=50, physics_enabled=True):
         "#ff8a65",
     ]
 
-    for idx, (item1, item2, weight) in enumerate(sorted_edges):
-        # Add nodes with colors
-        if item1 not in added_nodes:
-            degree = graph.degree(item1)
-            color = node_colors[hash(item1) % len(node_colors)]
-            net.add_node(
-                item1,
-                label=item1[:20],
-                title=f"{item1}\nConnections: {degree}",
-                size=12 + degree * 0.3,
-                color=color,
-                borderWidth=2,
-                borderWidthSelected=4,
-            )
-            added_nodes.add(item1)
-
-        if item2 not in added_nodes:
-            degree = graph.degree(item2)
-            color = node_colors[hash(item2) % len(node_colors)]
-            net.add_node(
-                item2,
-                label=item2[:20],
-                title=f"{item2}\nConnections: {degree}",
-                size=12 + degree * 0.3,
-                color=color,
-                borderWidth=2,
-                borderWidthSelected=4,
-            )
-            added_nodes.add(item2)
+    # Unique nodes in order of first appearance, so per-node metadata is
+    # computed once rather than for every edge the node appears in
+    added_nodes = list(
+        dict.fromkeys(
+            item for item1, item2, _ in sorted_edges for item in (item1, item2)
+        )
+    )
 
-        # Add edge with smooth curves
-        edge_width = 0.5 + (weight / max_weight) * 2
+    # Styling shared by every node/edge lives in the global options below
+    # rather than being repeated per element in the embedded HTML payload
+    for item in added_nodes:
+        degree = graph.degree(item)
+        # crc32 is deterministic across runs, unlike the salted built-in hash()
+        color = node_colors[zlib.crc32(item.encode("utf-8")) % len(node_colors)]
+        net.add_node(
+            item,
+            label=item[:20],
+            title=f"{item}\nConnections: {degree}",
+            size=12 + degree * 0.3,
+            color=color,
+        )
+
+    for item1, item2, weight in sorted_edges:
+        # Add edge, width scaled by relative frequency
+        edge_width = round(0.5 + (weight / max_weight) * 2, 2)
         net.add_edge(
             item1,
             item2,
             value=weight,
             title=f"{item1} + {item2}\nBought together: {weight} times",
             width=edge_width,
-            smooth={"type": "curvedCW", "roundness": 0.2},
         )
 
     # Configure options with hover highlighting
-    options = (
-        """
-    {
-      "nodes": {
-        "font": {"size": 12, "face": "arial"},
-        "shadow": true
-      },
-      "edges": {
-        "color": {
-          "inherit": false,
-          "color": "#848484",
-          "highlight": "#00ff00",
-          "hover": "#ffff00"
+    options = {
+        "nodes": {
+            "font": {"size": 12, "face": "arial"},
+            "borderWidth": 2,
+            "borderWidthSelected": 4,
+            "shadow": False,
+        },
+        "edges": {
+            "color": {
+                "inherit": False,
+                "color": "#848484",
+                "highlight": "#00ff00",
+                "hover": "#ffff00",
+            },
+            "smooth": (
+                {"type": "curvedCW", "roundness": 0.2} if smooth_edges else False
+            ),
+            "hoverWidth": 3,
+            "selectionWidth": 4,
         },
-        "smooth": {
-          "type": "curvedCW",
-          "roundness": 0.15
+        "interaction": {
+            "hover": True,
+            "hoverConnectedEdges": True,
+            "selectConnectedEdges": True,
+            "tooltipDelay": 100,
+            "hideEdgesOnDrag": True,
+            "hideNodesOnDrag": not smooth_edges,
         },
-        "hoverWidth": 3,
-        "selectionWidth": 4
-      },
-      "interaction": {
-        "hover": true,
-        "hoverConnectedEdges": true,
-        "selectConnectedEdges": true,
-        "tooltipDelay": 100,
-        "hideEdgesOnDrag": false,
-        "hideNodesOnDrag": false
-      },
-      "physics": {
-        "enabled": """
-        + str(physics_enabled).lower()
-        + """,
-        "barnesHut": {
-          "gravitationalConstant": -40000,
-          "centralGravity": 0.15,
-          "springLength": 250,
-          "springConstant": 0.04,
-          "damping": 0.2,
-          "avoidOverlap": 0.5
+        "layout": {"improvedLayout": len(added_nodes) <= LARGE_NETWORK_NODES},
+        "physics": {
+            "enabled": physics_enabled,
+            "solver": "forceAtlas2Based",
+            "forceAtlas2Based": {
+                "gravitationalConstant": -120,
+                "centralGravity": 0.01,
+                "springLength": 200,
+                "springConstant": 0.08,
+                "damping": 0.4,
+                "avoidOverlap": 0.5,
+            },
+            "minVelocity": 1,
+            "stabilization": {
+                "enabled": True,
+                "iterations": 1000,
+                "updateInterval": 50,
+            },
         },
-        "minVelocity": 0.75,
-        "stabilization": {
-          "enabled": true,
-          "iterations": 150
-        }
-      }
     }
+    net.set_options(json_dumps(options))
+
+    return net
+
+
+@st.cache_data
+def get_network_html(
+    max_transactions, max_edges, physics_enabled, _graph, _sorted_edges
+):
+    """
+    Render the PyVis network to an HTML string.
+
+    Cached per (dataset, max_edges, physics) so revisiting a setting is
+    instant; the HTML is generated in memory rather than via a temp file.
     """
+    net = create_pyvis_network(
+        _graph, _sorted_edges, max_edges=max_edges, physics_enabled=physics_enabled
     )
-    net.set_options(options)
+    if net is None:
+        return None
 
-    return net
+    return net.generate_html(notebook=False)
 
 
 def main():
@@ -222,12 +245,12 @@ def main():
 
     # Load data
     with st.spinner("Loading data..."):
-        transactions = load_supermarket_data(max_transactions)
+        transactions, graph = load_dataset(max_transactions)
 
         if transactions is None:
             st.stop()
 
-        graph = build_graph_cached(transactions)
+        sorted_edges = get_sorted_edges(max_transactions, graph)
 
     st.sidebar.success(f"{len(transactions)} transactions")
     st.sidebar.info(f"{graph.node_count()} unique items")
@@ -316,7 +339,11 @@ def main():
                     step=10,
                     help="Controls how many relationships to display",
                 )
-                physics = st.checkbox("Enable Physics Layout", value=True)
+                physics = st.checkbox(
+                    "Enable Physics Layout",
+                    value=False,
+                    help="Physics is slow to render for large networks",
+                )
 
                 st.info(
                     "Tips:\n- Drag nodes to rearrange\n- Scroll to zoom\n- Click nodes for info"
@@ -324,22 +351,12 @@ def main():
 
             with col1:
                 with st.spinner("Generating interactive network..."):
-                    net = create_pyvis_network(
-                        graph, max_edges=max_edges, physics_enabled=physics
+                    html_content = get_network_html(
+                        max_transactions, max_edges, physics, graph, sorted_edges
                     )
 
-                    if net:
-                        # Save to temp file and display
-                        with tempfile.NamedTemporaryFile(
-                            delete=False, suffix=".html", mode="w"
-                        ) as tmp:
-                            net.save_graph(tmp.name)
-                            with open(tmp.name, "r") as f:
-                                html_content = f.read()
-                            components.html(html_content, height=700, scrolling=False)
-
-                            # Clean up
-                            os.unlink(tmp.name)
+                    if html_content:
+                        components.html(html_content, height=700, scrolling=False)
                     else:
                         st.warning("Not enough data to generate network.")
 
@@ -347,8 +364,8 @@ def main():
     with tab2:
         st.header("Top Product Bundles")
 
-        # Get all bundles first to determine max values
-        all_bundles = get_top_bundles(graph, n=500)
+        # Slider bounds come from the precomputed sorted pair list
+        all_bundles = sorted_edges[:500]
         max_bundle_count = len(all_bundles)
         max_frequency = all_bundles[0][2] if all_bundles else 1
 
@@ -367,7 +384,7 @@ def main():
             step=1,
         )
 
-        top_bundles = get_top_bundles(graph, n=num_bundles)
+        top_bundles = sorted_edges[:num_bundles]
         filtered = [(i1, i2, w) for i1, i2, w in top_bundles if w >= min_freq]
 
         if filtered:
@@ -12,7 +12,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from utils.data_loader import load_transactions
+from utils.data_loader import load_supermarket_data
 from algorithms.graph_builder import build_graph_from_transactions
 from analysis.frequent_items import (
     find_items_bought_with,
@@ -22,60 +22,6 @@ from analysis.frequent_items import (
 from algorithms.search import bfs, dfs
 
 
-def load_supermarket_data(filepath: str, max_transactions: int = None):
-    """
-    Load the supermarket dataset.
-
-    Note: The dataset has one item per line, so we need special handling.
-    Format: Member_number,Date,itemDescription
-
-    Args:
-        filepath: Path to the CSV file
-        max_transactions: Limit number of transactions (for testing)
-
-    Returns:
-        List of transactions
-    """
-    print(f" Loading data from: {filepath}")
-    print("   (This only READS the file, never modifies it)")
-
-    import csv
-    from collections import defaultdict
-
-    # Group items by (member_number, date) to form transactions
-    transactions_dict = defaultdict(list)
-
-    start_time = time.time()
-
-    with open(filepath, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            member = row["Member_number"]
-            date = row["Date"]
-            item = row["itemDescription"].strip().lower()
-
-            if item:  # Only add non-empty items
-                transaction_key = f"{member}_{date}"
-                transactions_dict[transaction_key].append(item)
-
-    # Convert to list of transactions
-    transactions = list(transactions_dict.values())
-
-    # Remove duplicates within each transaction
-    transactions = [[*dict.fromkeys(txn)] for txn in transactions]
-
-    # Apply limit if specified
-    if max_transactions:
-        transactions = transactions[:max_transactions]
-
-    load_time = time.time() - start_time
-
-    print(f" Loaded {len(transactions)} transactions in {load_time:.2f}s")
-    print(f"   Original file has {len(transactions_dict)} unique shopping sessions")
-
-    return transactions
-
-
 def analyze_graph(graph):
     """Display basic graph statistics."""
     print(f"\n Graph Statistics:")
@@ -129,7 +75,14 @@ def main():
 
     # Step 1: Load data (read-only!)
     print("\n Step 1: Load Transaction Data")
-    transactions = load_supermarket_data(dataset_path, max_transactions=1000)
+    print(f" Loading data from: {dataset_path}")
+    print("   (This only READS the file, never modifies it)")
+    start_time = time.time()
+    all_transactions = load_supermarket_data(dataset_path)
+    transactions = all_transactions[:1000]
+    load_time = time.time() - start_time
+    print(f" Loaded {len(transactions)} transactions in {load_time:.2f}s")
+    print(f"   Original file has {len(all_transactions)} unique shopping sessions")
 
     if not transactions:
         print(" No transactions loaded!")
@@ -142,7 +95,7 @@ def main():
     # Step 2: Build graph
     print("\n Step 2: Build Item Network Graph")
     start_time = time.time()
-    graph = build_graph_from_transactions(transactions)
+    graph = build_graph_from_transactions(transactions, already_normalized=True)
     build_time = time.time() - start_time
     print(f" Graph built in {build_time:.2f}s")
 
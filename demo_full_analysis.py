@@ -9,7 +9,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from utils.data_loader import load_transactions
+from utils.data_loader import load_supermarket_data
 from algorithms.graph_builder import build_graph_from_transactions
 from analysis.frequent_items import (
     find_items_bought_with,
@@ -19,41 +19,6 @@ from analysis.frequent_items import (
 from algorithms.search import bfs, dfs
 
 
-def load_supermarket_data(filepath: str, max_transactions: int = None):
-    """Load supermarket dataset (one item per line format)."""
-    print(f" Loading data from: {filepath}")
-
-    import csv
-    from collections import defaultdict
-
-    transactions_dict = defaultdict(list)
-
-    start_time = time.time()
-
-    with open(filepath, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            member = row["Member_number"]
-            date = row["Date"]
-            item = row["itemDescription"].strip().lower()
-
-            if item:
-                transaction_key = f"{member}_{date}"
-                transactions_dict[transaction_key].append(item)
-
-    transactions = list(transactions_dict.values())
-    transactions = [[*dict.fromkeys(txn)] for txn in transactions]
-
-    if max_transactions:
-        transactions = transactions[:max_transactions]
-
-    load_time = time.time() - start_time
-
-    print(f" Loaded {len(transactions)} transactions in {load_time:.2f}s")
-
-    return transactions
-
-
 def main():
     print("=" * 70)
     print("  MARKET BASKET ANALYSIS - FULL Dataset")
@@ -63,7 +28,11 @@ def main():
 
     # Load ALL transactions
     print("\n Loading ALL Transactions...")
+    print(f" Loading data from: {dataset_path}")
+    start_time = time.time()
     transactions = load_supermarket_data(dataset_path)
+    load_time = time.time() - start_time
+    print(f" Loaded {len(transactions)} transactions in {load_time:.2f}s")
 
     print(f"\n   Total transactions: {len(transactions)}")
     print(f"   Sample: {transactions[0][:3]}...")
@@ -71,7 +40,7 @@ def main():
     # Build graph
     print("\n Building Complete Item Network...")
     start_time = time.time()
-    graph = build_graph_from_transactions(transactions)
+    graph = build_graph_from_transactions(transactions, already_normalized=True)
     build_time = time.time() - start_time
     print(f" Graph built in {build_time:.2f}s")
 
@@ -3,20 +3,36 @@ Graph builder algorithm.
 Constructs a graph from transaction data.
 """
 
-from typing import List
+from typing import Dict, Iterable, List, Tuple
+from collections import Counter
 from itertools import combinations
 from data_structures.graph import Graph
 
 
-def build_graph_from_transactions(transactions: List[List[str]]) -> Graph:
+def build_graph_from_transactions(
+    transactions: Iterable[List[str]],
+    already_normalized: bool = False,
+    weighted: bool = False,
+) -> Graph:
     """
     Build a graph from transaction data.
 
     Creates nodes for items and edges for co-purchased items.
     Edge weights represent co-occurrence frequency.
 
+    Co-occurrence counts are accumulated first (the upper triangle of the
+    item-by-item co-occurrence matrix, keyed by integer item ids), then
+    all unique pairs are added to the graph with one bulk_add_pairs call.
+
     Args:
-        transactions: List of transactions, each is a list of item names
+        transactions: Transactions, each a list of item names; any iterable
+            works, e.g. iter_transactions() to stream a file in one pass
+        already_normalized: If True, trust that items are already stripped,
+            lowercase, non-empty and unique within each transaction, and
+            skip the normalization pass
+        weighted: If True, each element is a (transaction, count) pair, as
+            returned by load_transactions(dedupe=True), and its pairs are
+            counted count times
 
     Returns:
         Graph with items as nodes and co-purchase relationships as edges
@@ -27,34 +43,62 @@ def build_graph_from_transactions(transactions: List[List[str]]) -> Graph:
     """
     graph = Graph()
 
-    # Process each transaction
+    # Integer id per unique item (first-seen order) and its reverse mapping
+    item_id: Dict[str, int] = {}
+    id_to_item: List[str] = []
+
+    # Co-occurrence counts keyed by (smaller id, larger id)
+    pair_counts: Dict[Tuple[int, int], int] = Counter()
+
     for transaction in transactions:
-        # Filter out empty or whitespace-only items, and normalize case
-        items = []
-        for item in transaction:
-            if item and item.strip():
-                items.append(item.strip().lower())  # Normalize to lowercase
-
-        # Remove duplicates within transaction
-        unique_items = []
-        seen = set()
+        count = 1
+        if weighted:
+            transaction, count = transaction
+
+        if already_normalized:
+            items = transaction
+        else:
+            # Normalize case, drop empty/whitespace items and remove
+            # duplicates in a single pass (dict preserves first-seen order)
+            items = dict.fromkeys(
+                item.strip().lower() for item in transaction if item and item.strip()
+            )
+
+        ids = []
         for item in items:
-            if item not in seen:
-                seen.add(item)
-                unique_items.append(item)
-
-        # Add all nodes (items)
-        for item in unique_items:
-            graph.add_node(item)
-
-        # Create edges for all pairs of items in the transaction
-        # This is the co-purchase relationship
-        for i in range(len(unique_items)):
-            for j in range(i + 1, len(unique_items)):
-                item1 = unique_items[i]
-                item2 = unique_items[j]
-
-                # Add edge with weight 1 (will accumulate if already exists)
-                graph.add_edge(item1, item2, weight=1)
+            if item not in item_id:
+                item_id[item] = len(id_to_item)
+                id_to_item.append(item)
+            ids.append(item_id[item])
+
+        # Single-item baskets contribute a node but no pairs
+        if len(ids) < 2:
+            continue
+
+        # Count every pair of items in the transaction, in basket order so
+        # edges reach the graph in the order they first co-occur (this
+        # fixes neighbour order, and with it traversal and tie order).
+        # Each key is canonicalized so (a, b) and (b, a) share one entry.
+        # Disk-cached graphs depend on this order: bump
+        # utils.cache.CACHE_FORMAT_VERSION if it changes.
+        pairs = [(a, b) if a < b else (b, a) for a, b in combinations(ids, 2)]
+        if count == 1:
+            pair_counts.update(pairs)
+        else:
+            # A basket seen count times adds count to each of its pairs
+            for pair in pairs:
+                pair_counts[pair] += count
+
+    # Add all nodes (items), including those never co-purchased
+    for item in id_to_item:
+        graph.add_node(item)
+
+    # Hand every unique pair and its accumulated weight to the graph at once
+    graph.bulk_add_pairs(
+        {
+            (id_to_item[a], id_to_item[b]): weight
+            for (a, b), weight in pair_counts.items()
+        }
+    )
 
     return graph
@@ -3,12 +3,22 @@ Search algorithms for graph traversal.
 Implements BFS and DFS for finding item associations.
 """
 
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Union
 from collections import deque
+from data_structures.frozen_graph import FrozenGraph
 from data_structures.graph import Graph
 
 
-def bfs(graph: Graph, start: str, max_depth: int = None) -> Dict[str, int]:
+def _is_frozen(graph) -> bool:
+    """Check whether the graph stores its adjacency in CSR arrays."""
+    # Duck-typed so snapshots imported via either the src. or the bare
+    # package path take the fast path
+    return hasattr(graph, "indptr")
+
+
+def bfs(
+    graph: Union[Graph, FrozenGraph], start: str, max_depth: int = None
+) -> Dict[str, int]:
     """
     Breadth-First Search traversal from a starting node.
 
@@ -33,28 +43,36 @@ def bfs(graph: Graph, start: str, max_depth: int = None) -> Dict[str, int]:
     if not graph.has_node(start):
         raise KeyError(f"Node '{start}' not found in graph")
 
+    if _is_frozen(graph):
+        return _bfs_frozen(graph, start, max_depth)
+
     # Initialize
     visited = {start: 0}  # Maps node to depth
-    queue = deque([(start, 0)])  # Queue of (node, depth) tuples
+    queue = deque([start])  # Depth is read back from visited, no tuples
 
     while queue:
-        current, depth = queue.popleft()
+        current = queue.popleft()
+        depth = visited[current]
 
-        # Check max_depth limit
+        # Nodes leave the queue in non-decreasing depth order, so once one
+        # is at max_depth every node still queued is too: none of them
+        # will be expanded and all are already recorded in visited
         if max_depth is not None and depth >= max_depth:
-            continue
+            break
 
         # Explore neighbors
         neighbors = graph.get_neighbors(current)
         for neighbor in neighbors:
             if neighbor not in visited:
                 visited[neighbor] = depth + 1
-                queue.append((neighbor, depth + 1))
+                queue.append(neighbor)
 
     return visited
 
 
-def dfs(graph: Graph, start: str, max_depth: int = None) -> List[str]:
+def dfs(
+    graph: Union[Graph, FrozenGraph], start: str, max_depth: int = None
+) -> List[str]:
     """
     Depth-First Search traversal from a starting node.
 
@@ -78,26 +96,88 @@ def dfs(graph: Graph, start: str, max_depth: int = None) -> List[str]:
     if not graph.has_node(start):
         raise KeyError(f"Node '{start}' not found in graph")
 
+    if _is_frozen(graph):
+        return _dfs_frozen(graph, start, max_depth)
+
     visited = []
     visited_set = set()
 
-    def _dfs_recursive(node: str, depth: int):
-        """Helper function for recursive DFS."""
+    # Explicit stack of (node, depth) avoids Python recursion overhead
+    # and the interpreter's recursion limit on long chains
+    stack = [(start, 0)]
+
+    while stack:
+        node, depth = stack.pop()
+
+        if node in visited_set:
+            continue
+
         # Mark as visited
         visited.append(node)
         visited_set.add(node)
 
         # Check max_depth limit
         if max_depth is not None and depth >= max_depth:
-            return
+            continue
 
-        # Explore neighbors
+        # Push neighbors in reverse so they are popped in original order,
+        # matching the visiting order of a recursive DFS
         neighbors = graph.get_neighbors(node)
-        for neighbor in neighbors:
+        for neighbor in reversed(neighbors):
             if neighbor not in visited_set:
-                _dfs_recursive(neighbor, depth + 1)
-
-    # Start DFS from start node
-    _dfs_recursive(start, 0)
+                stack.append((neighbor, depth + 1))
 
     return visited
+
+
+def _bfs_frozen(
+    graph: FrozenGraph, start: str, max_depth: int = None
+) -> Dict[str, int]:
+    """BFS over CSR arrays using integer node ids; same result as bfs."""
+    indptr, neighbors, nodes = graph.indptr, graph.neighbors, graph.nodes
+
+    start_id = graph.index[start]
+    depths = {start_id: 0}
+    queue = deque([start_id])
+
+    while queue:
+        current = queue.popleft()
+        depth = depths[current]
+
+        # Remaining nodes are all at max_depth (see bfs)
+        if max_depth is not None and depth >= max_depth:
+            break
+
+        for neighbor in neighbors[indptr[current] : indptr[current + 1]]:
+            if neighbor not in depths:
+                depths[neighbor] = depth + 1
+                queue.append(neighbor)
+
+    return {nodes[node]: depth for node, depth in depths.items()}
+
+
+def _dfs_frozen(graph: FrozenGraph, start: str, max_depth: int = None) -> List[str]:
+    """DFS over CSR arrays using integer node ids; same result as dfs."""
+    indptr, neighbors, nodes = graph.indptr, graph.neighbors, graph.nodes
+
+    order = []
+    seen = bytearray(len(nodes))
+    stack = [(graph.index[start], 0)]
+
+    while stack:
+        node, depth = stack.pop()
+
+        if seen[node]:
+            continue
+
+        order.append(node)
+        seen[node] = 1
+
+        if max_depth is not None and depth >= max_depth:
+            continue
+
+        for neighbor in reversed(neighbors[indptr[node] : indptr[node + 1]]):
+            if not seen[neighbor]:
+                stack.append((neighbor, depth + 1))
+
+    return [nodes[node] for node in order]
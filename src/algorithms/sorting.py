@@ -3,7 +3,12 @@ Custom sorting algorithms for market basket analysis.
 Implements merge sort to replace built-in sorted() function.
 """
 
-from typing import List, Tuple, Callable, Any
+from operator import gt, itemgetter, lt
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Runs shorter than this are extended with binary insertion sort before
+# merging, as in Timsort
+MIN_RUN = 32
 
 
 def merge_sort(
@@ -12,6 +17,10 @@ def merge_sort(
     """
     Sort a list using merge sort algorithm.
 
+    Natural runs in the input are detected first and short runs are
+    extended with binary insertion sort, so partially ordered data needs
+    fewer merge passes.
+
     Args:
         items: List of items to sort
         key: Optional function to extract comparison key from each item
@@ -20,63 +29,264 @@ def merge_sort(
     Returns:
         New sorted list (does not modify original)
 
-    Time Complexity: O(n log n)
+    Time Complexity: O(n log n), O(n) for input that is already sorted
+        in either direction
     Space Complexity: O(n)
     """
+    # Create a copy to avoid modifying original
+    return _merge_sort_inplace(list(items), key, reverse)
+
+
+def _merge_sort_inplace(
+    values: List[Any], key: Optional[Callable], reverse: bool
+) -> List[Any]:
+    """Sort values in place for merge_sort and return the same list."""
     # Handle empty or single-item lists
-    if len(items) <= 1:
-        return list(items)
+    n = len(values)
+    if n <= 1:
+        return values
 
-    # Create a copy to avoid modifying original
-    arr = list(items)
+    # Decorate: with a key function, compute every key exactly once into a
+    # list parallel to the values; all comparisons use the precomputed keys
+    # and every move is applied to both lists. Without one the values are
+    # their own keys, so only one list is moved.
+    keyed = key is not None
+    keys = list(map(key, values)) if keyed else values
+
+    # "Strictly before" for the requested direction
+    before = gt if reverse else lt
 
-    # Use identity function if no key provided
-    if key is None:
-        key = lambda x: x
+    def _next_run(lo: int) -> int:
+        """
+        Sort keys/values[lo:] into a run starting at lo; return its end.
 
-    def _merge(left: List[Any], right: List[Any]) -> List[Any]:
-        """Merge two sorted lists into one sorted list."""
-        result = []
-        i = j = 0
+        Takes the natural run starting at lo, reversing it if it runs the
+        wrong way, then extends runs shorter than MIN_RUN with binary
+        insertion sort.
+        """
+        hi = lo + 1
+        if hi < n and before(keys[hi], keys[lo]):
+            # Strictly wrong-way run: strictness keeps equal keys out,
+            # so reversing it in place cannot break stability
+            hi += 1
+            while hi < n and before(keys[hi], keys[hi - 1]):
+                hi += 1
+            keys[lo:hi] = reversed(keys[lo:hi])
+            if keyed:
+                values[lo:hi] = reversed(values[lo:hi])
+        else:
+            while hi < n and not before(keys[hi], keys[hi - 1]):
+                hi += 1
+
+        # Extend short runs by binary insertion; inserting after equal keys
+        # keeps the sort stable
+        end = min(lo + MIN_RUN, n)
+        while hi < end:
+            item_key, item = keys[hi], values[hi]
+            left, right = lo, hi
+            while left < right:
+                middle = (left + right) // 2
+                if before(item_key, keys[middle]):
+                    right = middle
+                else:
+                    left = middle + 1
+            keys[left + 1 : hi + 1] = keys[left:hi]
+            keys[left] = item_key
+            if keyed:
+                values[left + 1 : hi + 1] = values[left:hi]
+                values[left] = item
+            hi += 1
 
-        while i < len(left) and j < len(right):
-            left_key = key(left[i])
-            right_key = key(right[j])
+        return hi
 
-            if reverse:
-                # Descending order
+    def _merge(
+        src_keys: List[Any],
+        src: List[Any],
+        dst_keys: List[Any],
+        dst: List[Any],
+        lo: int,
+        mid: int,
+        hi: int,
+    ) -> None:
+        """Merge sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi]."""
+        i, j, k = lo, mid, lo
+        left_key = src_keys[i]
+        right_key = src_keys[j]
+
+        # The direction test is hoisted out of the loop; ties always take
+        # from the left so the sort is stable in both directions
+        if reverse:
+            # Descending order
+            while True:
                 if left_key >= right_key:
-                    result.append(left[i])
+                    dst_keys[k] = left_key
+                    dst[k] = src[i]
+                    k += 1
                     i += 1
+                    if i == mid:
+                        break
+                    left_key = src_keys[i]
                 else:
-                    result.append(right[j])
+                    dst_keys[k] = right_key
+                    dst[k] = src[j]
+                    k += 1
                     j += 1
-            else:
-                # Ascending order
+                    if j == hi:
+                        break
+                    right_key = src_keys[j]
+        else:
+            # Ascending order
+            while True:
                 if left_key <= right_key:
-                    result.append(left[i])
+                    dst_keys[k] = left_key
+                    dst[k] = src[i]
+                    k += 1
                     i += 1
+                    if i == mid:
+                        break
+                    left_key = src_keys[i]
                 else:
-                    result.append(right[j])
+                    dst_keys[k] = right_key
+                    dst[k] = src[j]
+                    k += 1
                     j += 1
+                    if j == hi:
+                        break
+                    right_key = src_keys[j]
+
+        # Copy whichever run has elements left
+        if i < mid:
+            dst_keys[k:hi] = src_keys[i:mid]
+            dst[k:hi] = src[i:mid]
+        else:
+            dst_keys[k:hi] = src_keys[j:hi]
+            dst[k:hi] = src[j:hi]
 
-        # Append remaining elements
-        result.extend(left[i:])
-        result.extend(right[j:])
-        return result
+    def _merge_values(
+        src: List[Any], dst: List[Any], lo: int, mid: int, hi: int
+    ) -> None:
+        """_merge for values that are their own keys: one list to move."""
+        i, j, k = lo, mid, lo
+        left = src[i]
+        right = src[j]
+
+        if reverse:
+            # Descending order
+            while True:
+                if left >= right:
+                    dst[k] = left
+                    k += 1
+                    i += 1
+                    if i == mid:
+                        break
+                    left = src[i]
+                else:
+                    dst[k] = right
+                    k += 1
+                    j += 1
+                    if j == hi:
+                        break
+                    right = src[j]
+        else:
+            # Ascending order
+            while True:
+                if left <= right:
+                    dst[k] = left
+                    k += 1
+                    i += 1
+                    if i == mid:
+                        break
+                    left = src[i]
+                else:
+                    dst[k] = right
+                    k += 1
+                    j += 1
+                    if j == hi:
+                        break
+                    right = src[j]
 
-    def _merge_sort(arr: List[Any]) -> List[Any]:
-        """Recursive merge sort implementation."""
-        if len(arr) <= 1:
-            return arr
+        # Copy whichever run has elements left
+        if i < mid:
+            dst[k:hi] = src[i:mid]
+        else:
+            dst[k:hi] = src[j:hi]
 
-        mid = len(arr) // 2
-        left = _merge_sort(arr[:mid])
-        right = _merge_sort(arr[mid:])
+    # Split into sorted runs. Presorted input, in either direction, is a
+    # single run.
+    bounds = [0]
+    while bounds[-1] < n:
+        bounds.append(_next_run(bounds[-1]))
+
+    # Bottom-up: merge adjacent runs pairwise back and forth between two
+    # buffers (buffer pairs when keyed) until one run is left, with no
+    # recursion
+    src_keys, src = keys, values
+    dst = [None] * n
+    dst_keys = [None] * n if keyed else dst
+    while len(bounds) > 2:
+        merged = [0]
+        for t in range(0, len(bounds) - 1, 2):
+            lo = bounds[t]
+            if t + 2 < len(bounds):
+                hi = bounds[t + 2]
+                if keyed:
+                    _merge(src_keys, src, dst_keys, dst, lo, bounds[t + 1], hi)
+                else:
+                    _merge_values(src, dst, lo, bounds[t + 1], hi)
+            else:
+                # Lone trailing run: carry it over unchanged
+                hi = n
+                dst[lo:hi] = src[lo:hi]
+                if keyed:
+                    dst_keys[lo:hi] = src_keys[lo:hi]
+            merged.append(hi)
+        src_keys, src, dst_keys, dst = dst_keys, dst, src_keys, src
+        bounds = merged
+
+    # The merged result may have ended up in the scratch buffer
+    if src is not values:
+        values[:] = src
+    return values
+
+
+def bucket_sort(
+    items: List[Any], key: Callable[[Any], Hashable], reverse: bool = False
+) -> List[Any]:
+    """
+    Stable sort for data with few distinct keys, such as co-occurrence counts.
+
+    Items are grouped into one bucket per distinct key in a single pass;
+    only the distinct keys are then merge sorted and the buckets are
+    concatenated in key order.
+
+    Args:
+        items: List of items to sort
+        key: Function extracting a hashable, comparable key from each item
+        reverse: If True, sort in descending order
+
+    Returns:
+        New sorted list (does not modify original)
+
+    Time Complexity: O(n + u log u) where u = number of distinct keys
+    Space Complexity: O(n)
+    """
+    # Zero or one item is already sorted; skip the key call and buckets
+    if len(items) < 2:
+        return list(items)
 
-        return _merge(left, right)
+    buckets: Dict[Hashable, List[Any]] = {}
+    for item in items:
+        item_key = key(item)
+        bucket = buckets.get(item_key)
+        if bucket is None:
+            buckets[item_key] = [item]
+        else:
+            bucket.append(item)
 
-    return _merge_sort(arr)
+    result = []
+    for item_key in merge_sort(list(buckets), reverse=reverse):
+        result.extend(buckets[item_key])
+    return result
 
 
 def sort_pairs_by_frequency(
@@ -92,7 +302,9 @@ def sort_pairs_by_frequency(
     Returns:
         Sorted list of pairs
     """
-    return merge_sort(pairs, key=lambda x: x[2], reverse=reverse)
+    # Frequencies are co-occurrence counts with few distinct values, so
+    # the stable bucket sort groups them in O(n) instead of comparing
+    return bucket_sort(pairs, key=itemgetter(2), reverse=reverse)
 
 
 def sort_associations_by_weight(
@@ -108,4 +320,4 @@ def sort_associations_by_weight(
     Returns:
         Sorted list of associations
     """
-    return merge_sort(associations, key=lambda x: x[1], reverse=reverse)
+    return bucket_sort(associations, key=itemgetter(1), reverse=reverse)
@@ -3,10 +3,17 @@ Frequent items analysis for market basket queries.
 Functions to find item associations and frequent itemsets.
 """
 
+import functools
+import heapq
+import weakref
+from itertools import takewhile
+from operator import itemgetter
 from typing import List, Tuple
 from data_structures.graph import Graph
-from algorithms.search import bfs
-from algorithms.sorting import merge_sort
+from algorithms.sorting import sort_pairs_by_frequency
+
+# Number of distinct query results kept by each memoized query
+QUERY_CACHE_SIZE = 4096
 
 
 def find_items_bought_with(
@@ -27,28 +34,56 @@ def find_items_bought_with(
     Raises:
         KeyError: If item not found in graph
     """
-    # Check if item exists
-    if not graph.has_node(item):
-        raise KeyError(f"Item '{item}' not found in graph")
+    # Repeat queries on an unchanged graph are answered from the cache;
+    # any mutation bumps the graph version and so misses it
+    return list(
+        _cached_items_bought_with(
+            weakref.ref(graph),
+            getattr(graph, "_version", 0),
+            item,
+            min_frequency,
+            limit,
+        )
+    )
+
+
+@functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _cached_items_bought_with(
+    graph_ref: "weakref.ref[Graph]",
+    version: int,
+    item: str,
+    min_frequency: int,
+    limit: int,
+) -> Tuple[Tuple[str, int], ...]:
+    """
+    Memoized find_items_bought_with, keyed on the graph and its version.
 
-    # Get all neighbors with their weights
-    neighbors = graph.get_neighbors(item)
+    The graph is passed as a weak reference rather than id(graph): a dead
+    reference only compares equal to itself, so a new graph that reuses a
+    collected graph's id can never hit its stale entries.
+    """
+    return tuple(_find_items_bought_with(graph_ref(), item, min_frequency, limit))
 
-    # Filter by minimum frequency
-    filtered = [
-        (neighbor, weight)
-        for neighbor, weight in neighbors.items()
-        if weight >= min_frequency
-    ]
 
-    # Sort by weight (frequency) in descending order using custom merge sort
-    sorted_items = merge_sort(filtered, key=lambda x: x[1], reverse=True)
+def _find_items_bought_with(
+    graph: Graph, item: str, min_frequency: int, limit: int
+) -> List[Tuple[str, int]]:
+    """Uncached implementation of find_items_bought_with."""
+    # Check if item exists
+    if not graph.has_node(item):
+        raise KeyError(f"Item '{item}' not found in graph")
 
-    # Apply limit if specified
-    if limit is not None:
-        sorted_items = sorted_items[:limit]
+    # The graph keeps each node's neighbours ranked by weight, so the
+    # answer is a prefix of that ranking: stop at the limit or at the first
+    # weight below min_frequency, whichever comes first
+    ranked = graph.get_sorted_neighbors(item)
+    if limit is not None and limit >= 0:
+        ranked = ranked[:limit]
+    result = list(takewhile(lambda pair: pair[1] >= min_frequency, ranked))
 
-    return sorted_items
+    # A negative limit slices like list[:limit], dropping from the end of
+    # the filtered result
+    return result if limit is None else result[:limit]
 
 
 def get_top_associations(
@@ -69,25 +104,37 @@ def get_top_associations(
     Raises:
         KeyError: If item not found in graph
     """
-    # Use BFS to find items within max_depth
-    reachable = bfs(graph, item, max_depth=max_depth)
+    return list(
+        _cached_top_associations(
+            weakref.ref(graph), getattr(graph, "_version", 0), item, n, max_depth
+        )
+    )
+
 
-    # Collect associations with weights
-    associations = []
-    for node in reachable:
-        if node != item:  # Exclude the item itself
-            # Get weight from graph
-            weight = graph.get_edge_weight(item, node)
-            if weight > 0:  # Direct neighbor
-                associations.append((node, weight))
-            # For indirect connections (depth > 1), we'd need path finding
-            # For now, only include direct neighbors with edges
+@functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _cached_top_associations(
+    graph_ref: "weakref.ref[Graph]", version: int, item: str, n: int, max_depth: int
+) -> Tuple[Tuple[str, int], ...]:
+    """Memoized get_top_associations, keyed like _cached_items_bought_with."""
+    return tuple(_get_top_associations(graph_ref(), item, n, max_depth))
 
-    # Sort by weight descending using custom merge sort
-    associations = merge_sort(associations, key=lambda x: x[1], reverse=True)
 
-    # Return top N
-    return associations[:n]
+def _get_top_associations(
+    graph: Graph, item: str, n: int, max_depth: int
+) -> List[Tuple[str, int]]:
+    """Uncached implementation of get_top_associations."""
+    if not graph.has_node(item):
+        raise KeyError(f"Item '{item}' not found in graph")
+
+    # Only direct neighbours have an edge weight to the item, so nodes a
+    # deeper search would reach never score. Any depth of at least 1
+    # therefore yields the neighbour ranking, without running a BFS.
+    if max_depth is not None and max_depth < 1:
+        return []
+
+    # The cached ranking is weight-descending with ties in neighbour
+    # order, exactly what a stable top-N selection would return
+    return list(graph.get_sorted_neighbors(item)[:n])
 
 
 def get_frequent_pairs(
@@ -103,18 +150,14 @@ def get_frequent_pairs(
     Returns:
         List of (item1, item2, frequency) tuples sorted by frequency descending
     """
-    # Get all edges from the graph
-    edges = graph.get_all_edges()
+    # Filter while scanning so rejected edges never become tuples. The
+    # per-node rankings are deliberately not used: a whole-graph scan
+    # would fill them for every node and keep that copy alive.
+    filtered = list(graph.iter_edges(min_frequency))
 
-    # Filter by minimum frequency
-    filtered = [
-        (item1, item2, weight)
-        for item1, item2, weight in edges
-        if weight >= min_frequency
-    ]
-
-    # Sort by frequency (weight) in descending order using custom merge sort
-    sorted_pairs = merge_sort(filtered, key=lambda x: x[2], reverse=True)
+    # Sort by frequency (weight) in descending order. Weights are small
+    # integers with few distinct values, so a stable bucket sort is O(E)
+    sorted_pairs = sort_pairs_by_frequency(filtered)
 
     return sorted_pairs
 
@@ -130,8 +173,11 @@ def get_top_bundles(graph: Graph, n: int = 10) -> List[Tuple[str, str, int]]:
     Returns:
         List of (item1, item2, frequency) tuples for top N bundles
     """
-    # Get all pairs sorted by frequency
-    all_pairs = get_frequent_pairs(graph, min_frequency=1)
-
-    # Return top N
-    return all_pairs[:n]
+    # A negative n slices like list[:n], dropping the lightest bundles, so
+    # it needs the full sorted list
+    if n < 0:
+        return get_frequent_pairs(graph)[:n]
+
+    # Select the top N edges with a bounded heap rather than sorting all
+    # pairs; ties keep edge order, matching get_frequent_pairs(graph)[:n]
+    return heapq.nlargest(n, graph.iter_edges(), key=itemgetter(2))
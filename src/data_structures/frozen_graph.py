@@ -0,0 +1,250 @@
+"""
+Read-only graph snapshot for Market Basket Analysis.
+Stores co-purchase edges in compressed sparse row (CSR) arrays.
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Tuple
+
+from data_structures.ranking import cached_ranking
+
+
+class FrozenGraph:
+    """
+    Immutable, compact version of Graph for querying a finished graph.
+
+    Nodes are numbered 0..V-1. The neighbours of node i are
+    neighbors[indptr[i]:indptr[i + 1]], with the matching edge weights at
+    the same positions in weights. Each undirected edge is stored once per
+    direction, in the same order as the Graph it was frozen from, so
+    traversals visit nodes in the same order on both.
+
+    The arrays hold machine integers rather than one Python dict per node,
+    which makes the snapshot several times smaller than the dict-of-dicts
+    adjacency list it replaces.
+
+    Time Complexity:
+        - has_node: O(1)
+        - has_edge: O(d) where d = degree of item1
+        - get_neighbors: O(d)
+        - get_edge_weight: O(d)
+        - get_sorted_neighbors: O(d) first call, O(1) after
+        - degree: O(1)
+
+    Space Complexity: O(V + E) where V is nodes and E is edges
+    """
+
+    def __init__(
+        self,
+        nodes: List[str],
+        indptr: array,
+        neighbors: array,
+        weights: array,
+    ):
+        """
+        Initialize a frozen graph from CSR arrays.
+
+        Use Graph.freeze() rather than calling this directly.
+
+        Args:
+            nodes: Item name for each node id
+            indptr: Row offsets, length V + 1
+            neighbors: Neighbour node ids, length 2E
+            weights: Edge weights aligned with neighbors, length 2E
+        """
+        self.nodes = nodes
+        self.indptr = indptr
+        self.neighbors = neighbors
+        self.weights = weights
+        self.index: Dict[str, int] = {item: i for i, item in enumerate(nodes)}
+        # Neighbours ranked by weight, built lazily per node
+        self._sorted_neighbors: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+
+    def _find(self, item1: str, item2: str) -> int:
+        """Return the CSR position of edge (item1, item2), or -1 if absent."""
+        i = self.index.get(item1)
+        j = self.index.get(item2)
+        if i is None or j is None:
+            return -1
+        try:
+            return self.neighbors.index(j, self.indptr[i], self.indptr[i + 1])
+        except ValueError:
+            return -1
+
+    def has_node(self, item: str) -> bool:
+        """
+        Check if a node exists in the graph.
+
+        Args:
+            item: Item name to check
+
+        Returns:
+            True if node exists, False otherwise
+        """
+        return item in self.index
+
+    def has_edge(self, item1: str, item2: str) -> bool:
+        """
+        Check if an edge exists between two items.
+
+        Args:
+            item1: First item name
+            item2: Second item name
+
+        Returns:
+            True if edge exists, False otherwise
+        """
+        return self._find(item1, item2) >= 0
+
+    def get_neighbors(self, item: str) -> Dict[str, int]:
+        """
+        Get all neighbors of an item with their edge weights.
+
+        Args:
+            item: Item name
+
+        Returns:
+            Dictionary mapping neighbor items to edge weights
+
+        Raises:
+            KeyError: If item not found in graph
+        """
+        if item not in self.index:
+            raise KeyError(f"Item '{item}' not found in graph")
+
+        i = self.index[item]
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        nodes = self.nodes
+        return {
+            nodes[j]: weight
+            for j, weight in zip(self.neighbors[lo:hi], self.weights[lo:hi])
+        }
+
+    def get_sorted_neighbors(self, item: str) -> Tuple[Tuple[str, int], ...]:
+        """
+        Get the neighbors of an item ranked by edge weight.
+
+        The snapshot never changes, so each ranking is computed once.
+
+        Args:
+            item: Item name
+
+        Returns:
+            Tuple of (neighbor, weight) pairs sorted by weight descending.
+            Equal weights keep the order of get_neighbors.
+
+        Raises:
+            KeyError: If item not found in graph
+        """
+        return cached_ranking(self._sorted_neighbors, item, self.get_neighbors)
+
+    def get_edge_weight(self, item1: str, item2: str) -> int:
+        """
+        Get the weight of an edge between two items.
+
+        Args:
+            item1: First item name
+            item2: Second item name
+
+        Returns:
+            Edge weight, or 0 if edge doesn't exist
+        """
+        position = self._find(item1, item2)
+        return self.weights[position] if position >= 0 else 0
+
+    def get_all_nodes(self) -> List[str]:
+        """
+        Get all nodes in the graph.
+
+        Returns:
+            List of all item names in the graph
+        """
+        return list(self.nodes)
+
+    def get_all_edges(self) -> List[Tuple[str, str, int]]:
+        """
+        Get all edges in the graph as list of tuples.
+
+        Returns:
+            List of tuples (item1, item2, weight) representing edges.
+            Each edge appears once (not duplicated for undirected).
+        """
+        return list(self.iter_edges())
+
+    def iter_edges(self, min_weight: int = 1) -> Iterator[Tuple[str, str, int]]:
+        """
+        Iterate over edges without building the full edge list.
+
+        Args:
+            min_weight: Minimum weight of edges to yield
+
+        Yields:
+            Tuples (item1, item2, weight) in get_all_edges order
+        """
+        nodes, indptr, neighbors, weights = (
+            self.nodes,
+            self.indptr,
+            self.neighbors,
+            self.weights,
+        )
+        for i, item1 in enumerate(nodes):
+            lo, hi = indptr[i], indptr[i + 1]
+            for j, weight in zip(neighbors[lo:hi], weights[lo:hi]):
+                # Report each edge from the endpoint with the smaller id
+                if weight >= min_weight and i < j:
+                    yield (item1, nodes[j], weight)
+
+    def node_count(self) -> int:
+        """
+        Get the number of nodes in the graph.
+
+        Returns:
+            Number of nodes
+        """
+        return len(self.nodes)
+
+    def edge_count(self) -> int:
+        """
+        Get the number of edges in the graph.
+
+        Returns:
+            Number of unique edges (counting each undirected edge once)
+        """
+        return len(self.neighbors) // 2
+
+    def degree(self, item: str) -> int:
+        """
+        Get the degree (number of neighbors) of a node.
+
+        Args:
+            item: Item name
+
+        Returns:
+            Number of neighbors (degree)
+
+        Raises:
+            KeyError: If item not found in graph
+        """
+        if item not in self.index:
+            raise KeyError(f"Item '{item}' not found in graph")
+
+        i = self.index[item]
+        return self.indptr[i + 1] - self.indptr[i]
+
+    def is_empty(self) -> bool:
+        """
+        Check if the graph is empty (no nodes).
+
+        Returns:
+            True if graph has no nodes, False otherwise
+        """
+        return len(self.nodes) == 0
+
+    def __repr__(self) -> str:
+        """
+        Repr representation of the graph.
+
+        Returns:
+            String representation for debugging
+        """
+        return f"FrozenGraph({self.node_count()} nodes, {self.edge_count()} edges)"
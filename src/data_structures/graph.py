@@ -2,7 +2,19 @@
 Graph data structure for Market Basket Analysis.
 Represents items as nodes and co-purchase relationships as weighted edges.
 """
-from typing import Dict, List, Tuple
+import sys
+from array import array
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Tuple
+
+from data_structures.frozen_graph import FrozenGraph
+from data_structures.ranking import cached_ranking
+
+# Shared read-only stand-in for the neighbours of a missing node
+_NO_NEIGHBORS: Mapping[str, int] = MappingProxyType({})
+
+# Largest weight a 32-bit frozen weights array can hold
+_INT32_MAX = 2**31 - 1
 
 
 class Graph:
@@ -16,14 +28,20 @@ class Graph:
     Time Complexity:
         - add_node: O(1)
         - add_edge: O(1)
+        - bulk_add_pairs: O(P) for P pairs
         - has_node: O(1)
         - has_edge: O(1)
         - get_neighbors: O(1)
         - get_edge_weight: O(1)
+        - get_sorted_neighbors: O(d) first call, O(1) after
     
     Space Complexity: O(V + E) where V is nodes and E is edges
     """
     
+    # Bumped by every mutation so query caches can tell the graph changed.
+    # A class attribute so graphs unpickled from older caches still have it.
+    _version = 0
+    
     def __init__(self):
         """
         Initialize an empty graph.
@@ -31,6 +49,20 @@ class Graph:
         Uses adjacency list representation: {item: {neighbor: weight, ...}}
         """
         self._adjacency_list: Dict[str, Dict[str, int]] = {}
+        # Per-node neighbours ranked by weight, built lazily and dropped for
+        # a node whenever one of its edges changes
+        self._sorted_neighbors: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+    
+    def __getstate__(self) -> dict:
+        """Pickle the graph without its derived sorted-neighbour cache."""
+        state = self.__dict__.copy()
+        state.pop("_sorted_neighbors", None)
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled graph with an empty sorted-neighbour cache."""
+        self.__dict__.update(state)
+        self._sorted_neighbors = {}
     
     def add_node(self, item: str) -> None:
         """
@@ -43,7 +75,9 @@ class Graph:
             If node already exists, this is a no-op.
         """
         if item not in self._adjacency_list:
-            self._adjacency_list[item] = {}
+            # Interned so every reference to this item shares one string
+            self._adjacency_list[sys.intern(item)] = {}
+            self._version += 1
     
     def add_edge(self, item1: str, item2: str, weight: int = 1) -> None:
         """
@@ -71,18 +105,61 @@ class Graph:
         if weight <= 0:
             raise ValueError("Weight must be positive")
         
+        # Intern names so node keys and neighbour keys share one string
+        # object per item, however the caller built them
+        item1 = sys.intern(item1)
+        item2 = sys.intern(item2)
+        
         # Add nodes if they don't exist
-        self.add_node(item1)
-        self.add_node(item2)
+        neighbors1 = self._adjacency_list.setdefault(item1, {})
+        neighbors2 = self._adjacency_list.setdefault(item2, {})
         
         # Add edge in both directions (undirected graph)
         # If edge exists, add to existing weight
-        if item2 in self._adjacency_list[item1]:
-            self._adjacency_list[item1][item2] += weight
-            self._adjacency_list[item2][item1] += weight
-        else:
-            self._adjacency_list[item1][item2] = weight
-            self._adjacency_list[item2][item1] = weight
+        neighbors1[item2] = neighbors1.get(item2, 0) + weight
+        neighbors2[item1] = neighbors2.get(item1, 0) + weight
+        self._sorted_neighbors.pop(item1, None)
+        self._sorted_neighbors.pop(item2, None)
+        self._version += 1
+    
+    def bulk_add_pairs(self, counts: Mapping[Tuple[str, str], int]) -> None:
+        """
+        Add many weighted edges in a single pass.
+        
+        Equivalent to calling add_edge(item1, item2, weight) for every
+        ((item1, item2), weight) in counts, but looks up each adjacency dict
+        once per edge instead of re-validating and re-adding both nodes.
+        
+        Args:
+            counts: Mapping of (item1, item2) pairs to weights to add
+            
+        Raises:
+            ValueError: If item names are empty, identical (self-loop), 
+                       or weight is non-positive
+        """
+        # Validate the whole batch first, so a bad pair leaves the graph
+        # (and its version) untouched rather than half-updated
+        for (item1, item2), weight in counts.items():
+            if not item1 or not item2:
+                raise ValueError("Item names cannot be empty")
+            if item1 == item2:
+                raise ValueError("Self-loops are not allowed")
+            if weight <= 0:
+                raise ValueError("Weight must be positive")
+        
+        adjacency = self._adjacency_list
+        sorted_neighbors = self._sorted_neighbors
+        for (item1, item2), weight in counts.items():
+            item1 = sys.intern(item1)
+            item2 = sys.intern(item2)
+            neighbors1 = adjacency.setdefault(item1, {})
+            neighbors2 = adjacency.setdefault(item2, {})
+            neighbors1[item2] = neighbors1.get(item2, 0) + weight
+            neighbors2[item1] = neighbors2.get(item1, 0) + weight
+            if sorted_neighbors:
+                sorted_neighbors.pop(item1, None)
+                sorted_neighbors.pop(item2, None)
+        self._version += 1
     
     def has_node(self, item: str) -> bool:
         """
@@ -107,11 +184,9 @@ class Graph:
         Returns:
             True if edge exists, False otherwise
         """
-        if item1 not in self._adjacency_list:
-            return False
-        return item2 in self._adjacency_list[item1]
+        return item2 in self._adjacency_list.get(item1, _NO_NEIGHBORS)
     
-    def get_neighbors(self, item: str) -> Dict[str, int]:
+    def get_neighbors(self, item: str) -> Mapping[str, int]:
         """
         Get all neighbors of an item with their edge weights.
         
@@ -119,7 +194,8 @@ class Graph:
             item: Item name
             
         Returns:
-            Dictionary mapping neighbor items to edge weights
+            Read-only mapping of neighbor items to edge weights. It is a
+            live view: later changes to the graph are reflected in it.
             
         Raises:
             KeyError: If item not found in graph
@@ -127,8 +203,27 @@ class Graph:
         if item not in self._adjacency_list:
             raise KeyError(f"Item '{item}' not found in graph")
         
-        # Return a copy to prevent external modification
-        return self._adjacency_list[item].copy()
+        # Read-only view prevents external modification without copying
+        return MappingProxyType(self._adjacency_list[item])
+    
+    def get_sorted_neighbors(self, item: str) -> Tuple[Tuple[str, int], ...]:
+        """
+        Get the neighbors of an item ranked by edge weight.
+        
+        The ranking is computed on first use and cached until an edge of
+        the item changes, so repeated top-k queries only slice it.
+        
+        Args:
+            item: Item name
+            
+        Returns:
+            Tuple of (neighbor, weight) pairs sorted by weight descending.
+            Equal weights keep the order of get_neighbors.
+            
+        Raises:
+            KeyError: If item not found in graph
+        """
+        return cached_ranking(self._sorted_neighbors, item, self.get_neighbors)
     
     def get_edge_weight(self, item1: str, item2: str) -> int:
         """
@@ -141,9 +236,8 @@ class Graph:
         Returns:
             Edge weight, or 0 if edge doesn't exist
         """
-        if not self.has_edge(item1, item2):
-            return 0
-        return self._adjacency_list[item1][item2]
+        # One lookup per level; a missing node falls back to an empty map
+        return self._adjacency_list.get(item1, _NO_NEIGHBORS).get(item2, 0)
     
     def get_all_nodes(self) -> List[str]:
         """
@@ -162,18 +256,31 @@ class Graph:
             List of tuples (item1, item2, weight) representing edges.
             Each edge appears once (not duplicated for undirected).
         """
-        edges = []
-        seen = set()
+        return list(self.iter_edges())
+    
+    def iter_edges(self, min_weight: int = 1) -> Iterator[Tuple[str, str, int]]:
+        """
+        Iterate over edges without building the full edge list.
+        
+        Yields edges in the same order as get_all_edges. Edges lighter
+        than min_weight are skipped before their tuple is created, so
+        filtered scans only pay for the edges they keep.
+        
+        Args:
+            min_weight: Minimum weight of edges to yield
+            
+        Yields:
+            Tuples (item1, item2, weight), each edge exactly once
+        """
+        done = set()
         
         for item1, neighbors in self._adjacency_list.items():
             for item2, weight in neighbors.items():
-                # Create a canonical edge representation to avoid duplicates
-                edge = tuple(sorted([item1, item2]))
-                if edge not in seen:
-                    seen.add(edge)
-                    edges.append((item1, item2, weight))
-        
-        return edges
+                # An edge to an already processed node was reported from
+                # that node's side, so each edge is emitted exactly once
+                if weight >= min_weight and item2 not in done:
+                    yield (item1, item2, weight)
+            done.add(item1)
     
     def remove_node(self, item: str) -> None:
         """
@@ -193,9 +300,12 @@ class Graph:
         for neighbor in neighbors:
             if neighbor in self._adjacency_list:
                 self._adjacency_list[neighbor].pop(item, None)
+            self._sorted_neighbors.pop(neighbor, None)
+        self._sorted_neighbors.pop(item, None)
         
         # Remove the node itself
         del self._adjacency_list[item]
+        self._version += 1
     
     def remove_edge(self, item1: str, item2: str) -> None:
         """
@@ -211,6 +321,9 @@ class Graph:
         if self.has_edge(item1, item2):
             del self._adjacency_list[item1][item2]
             del self._adjacency_list[item2][item1]
+            self._sorted_neighbors.pop(item1, None)
+            self._sorted_neighbors.pop(item2, None)
+            self._version += 1
     
     def node_count(self) -> int:
         """
@@ -259,6 +372,38 @@ class Graph:
         """
         return len(self._adjacency_list) == 0
     
+    def freeze(self) -> FrozenGraph:
+        """
+        Create a compact read-only snapshot of the graph.
+        
+        Once a graph is fully built it is only queried, so the snapshot
+        stores adjacency in CSR arrays instead of one dict per node. Node
+        and neighbour order are preserved, so searches return the same
+        results on the snapshot as on this graph.
+        
+        Returns:
+            FrozenGraph with the same nodes, edges and weights
+        """
+        nodes = list(self._adjacency_list)
+        index = {item: i for i, item in enumerate(nodes)}
+        
+        # Node ids and weights are stored as 32-bit ints, half the size of
+        # "l" on 64-bit platforms; weights widen to 64 bits only when the
+        # graph holds one too large for 32
+        max_weight = max(
+            (max(adjacent.values(), default=0) for adjacent in self._adjacency_list.values()),
+            default=0,
+        )
+        indptr = array("l", [0])
+        neighbors = array("i")
+        weights = array("i" if max_weight <= _INT32_MAX else "q")
+        for adjacent in self._adjacency_list.values():
+            neighbors.extend(index[neighbor] for neighbor in adjacent)
+            weights.extend(adjacent.values())
+            indptr.append(len(neighbors))
+        
+        return FrozenGraph(nodes, indptr, neighbors, weights)
+    
     def __str__(self) -> str:
         """
         String representation of the graph.
@@ -0,0 +1,37 @@
+"""
+Per-node neighbour rankings shared by Graph and FrozenGraph.
+"""
+
+from typing import Callable, Dict, Mapping, Tuple
+
+from algorithms.sorting import sort_associations_by_weight
+
+
+def cached_ranking(
+    cache: Dict[str, Tuple[Tuple[str, int], ...]],
+    item: str,
+    get_neighbors: Callable[[str], Mapping[str, int]],
+) -> Tuple[Tuple[str, int], ...]:
+    """
+    Get an item's neighbours ranked by edge weight, computing them once.
+
+    Args:
+        cache: The graph's item -> ranking cache; filled on a miss
+        item: Item name
+        get_neighbors: The graph's get_neighbors method
+
+    Returns:
+        Tuple of (neighbor, weight) pairs sorted by weight descending.
+        Equal weights keep the order of get_neighbors.
+
+    Raises:
+        KeyError: If item not found in graph
+    """
+    ranked = cache.get(item)
+    if ranked is None:
+        # Weights are co-occurrence counts with few distinct values, so the
+        # stable bucket sort ranks a row in O(d + u log u) for u distinct
+        # weights instead of comparison sorting all d neighbours
+        ranked = tuple(sort_associations_by_weight(list(get_neighbors(item).items())))
+        cache[item] = ranked
+    return ranked
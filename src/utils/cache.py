@@ -0,0 +1,157 @@
+"""
+Disk cache for parsed transactions and their item graph.
+Lets repeated runs skip CSV parsing and graph construction entirely.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from algorithms.graph_builder import build_graph_from_transactions
+from algorithms.sorting import merge_sort
+from data_structures.graph import Graph
+
+# data/processed/ is the project's location for cached/optimized data
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / "data" / "processed"
+
+# Number of cache entries kept before the least recently used are evicted
+MAX_CACHE_ENTRIES = 8
+
+# Part of every cache key. Bump it whenever the pickled transactions or
+# graph change shape or order (e.g. a graph_builder change to edge or
+# neighbour order), so entries written by older code are never served.
+CACHE_FORMAT_VERSION = 1
+
+_CACHE_PREFIX = "basket-"
+
+
+def cache_key(
+    filepath: str, max_transactions: int = None, loader: Callable = None
+) -> str:
+    """
+    Compute the cache key for a dataset file.
+
+    The key changes whenever the file is modified (mtime or size), so a
+    stale cache entry is never returned for an edited dataset. It also
+    names the loader, since different loaders parse the same file into
+    different transactions, and CACHE_FORMAT_VERSION, so entries built by
+    older code are rebuilt.
+
+    Args:
+        filepath: Path to the source CSV file
+        max_transactions: Transaction limit the data was loaded with
+        loader: Function the data was loaded with
+
+    Returns:
+        Hex digest identifying (format version, path, mtime, size,
+        max_transactions, loader)
+
+    Raises:
+        FileNotFoundError: If file does not exist
+    """
+    stat = os.stat(filepath)
+    loader_name = (
+        f"{loader.__module__}.{loader.__qualname__}" if loader is not None else ""
+    )
+    raw = (
+        f"{CACHE_FORMAT_VERSION}|{os.path.abspath(filepath)}"
+        f"|{stat.st_mtime_ns}|{stat.st_size}"
+        f"|{max_transactions}|{loader_name}"
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def load_or_build(
+    filepath: str,
+    loader: Callable[[str, Optional[int]], List[List[str]]],
+    max_transactions: int = None,
+    cache_dir: str = None,
+    already_normalized: bool = False,
+) -> Tuple[List[List[str]], Graph]:
+    """
+    Load transactions and their graph from the disk cache, or build them.
+
+    On a cache miss the loader is called, the graph is built and both are
+    pickled to the cache directory for subsequent runs.
+
+    Args:
+        filepath: Path to the source CSV file
+        loader: Function (filepath, max_transactions) -> transactions
+        max_transactions: Maximum number of transactions to load (None = all)
+        cache_dir: Directory holding cache files (default: data/processed)
+        already_normalized: Passed to build_graph_from_transactions when
+            the loader already returns normalized, deduplicated items
+
+    Returns:
+        Tuple of (transactions, graph)
+
+    Raises:
+        FileNotFoundError: If file does not exist
+    """
+    cache_path = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+    key = cache_key(filepath, max_transactions, loader)
+    cache_file = cache_path / f"{_CACHE_PREFIX}{key}.pkl"
+
+    if cache_file.exists():
+        try:
+            with open(cache_file, "rb") as f:
+                transactions, graph = pickle.load(f)
+            # Mark as recently used for eviction
+            os.utime(cache_file)
+            return transactions, graph
+        except (
+            OSError,
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ValueError,
+            ImportError,
+        ):
+            # Corrupt or incompatible entry (including one whose classes
+            # have since moved module): fall through and rebuild it
+            pass
+
+    transactions = loader(filepath, max_transactions)
+    graph = build_graph_from_transactions(
+        transactions, already_normalized=already_normalized
+    )
+
+    tmp_file = None
+    try:
+        cache_path.mkdir(parents=True, exist_ok=True)
+        # Write to a uniquely named temporary file first, so readers never
+        # see a partial pickle and concurrent writers never share one
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path, prefix=_CACHE_PREFIX, suffix=".tmp", delete=False
+        ) as f:
+            tmp_file = f.name
+            pickle.dump((transactions, graph), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+        tmp_file = None
+        _evict_old_entries(cache_path)
+    except OSError:
+        # Caching is best-effort; a read-only location must not break loading
+        if tmp_file is not None:
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+
+    return transactions, graph
+
+
+def _evict_old_entries(cache_path: Path) -> None:
+    """Remove least recently used cache files beyond MAX_CACHE_ENTRIES."""
+    entries = list(cache_path.glob(f"{_CACHE_PREFIX}*.pkl"))
+    if len(entries) <= MAX_CACHE_ENTRIES:
+        return
+
+    entries = merge_sort(entries, key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in entries[MAX_CACHE_ENTRIES:]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
@@ -3,8 +3,11 @@ Data loading utilities for market basket transactions.
 Loads and parses CSV transaction data.
 """
 
-from typing import List
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Tuple, Union
+import functools
+import itertools
 import os
+import sys
 
 
 def parse_transaction_line(line: str) -> List[str]:
@@ -15,56 +18,50 @@ def parse_transaction_line(line: str) -> List[str]:
         line: Comma-separated line of items
 
     Returns:
-        List of item names (trimmed, lowercase, duplicates removed)
+        List of item names (trimmed, lowercase, duplicates removed, interned)
     """
     # Handle empty or whitespace-only lines
-    if not line or not line.strip():
+    line = line.strip() if line else ""
+    if not line:
         return []
 
-    # Split by comma
-    items = line.split(",")
+    # Lowercase the whole line once, split by comma, strip whitespace and
+    # filter empty items; dict.fromkeys removes duplicates while
+    # preserving order
+    items = map(str.strip, line.lower().split(","))
 
-    # Process items: strip whitespace, lowercase, filter empty
-    processed_items = []
-    for item in items:
-        item = item.strip()  # Remove whitespace
-        if item:  # Filter empty strings
-            item = item.lower()  # Normalize to lowercase
-            processed_items.append(item)
+    # Intern item names so every transaction (and later the graph) shares
+    # one string object per unique item instead of one per occurrence
+    return list(map(sys.intern, dict.fromkeys(filter(None, items))))
 
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_items = []
-    for item in processed_items:
-        if item not in seen:
-            seen.add(item)
-            unique_items.append(item)
 
-    return unique_items
-
-
-def load_transactions(
-    filepath: str, has_header: bool = False, max_transactions: int = None
-) -> List[List[str]]:
+def iter_transactions(filepath: str, has_header: bool = False) -> Iterator[List[str]]:
     """
-    Load transactions from CSV file.
+    Lazily yield transactions from a CSV file, one line at a time.
+
+    Only the current line is held in memory, so large files can be fed
+    straight into graph construction without building the full list.
 
     Args:
         filepath: Path to CSV file
         has_header: Whether first line is a header to skip
-        max_transactions: Maximum number of transactions to load (None = all)
 
     Returns:
-        List of transactions, where each transaction is a list of items
+        Iterator over transactions, each a list of items (empty lines skipped)
 
     Raises:
         FileNotFoundError: If file does not exist
     """
-    # Check if file exists
+    # Check if file exists (eagerly, not on first iteration)
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"File not found: {filepath}")
 
-    transactions = []
+    return _parse_lines(_read_lines(filepath, has_header))
+
+
+def _read_lines(filepath: str, has_header: bool) -> Iterator[str]:
+    """Yield the file's lines, falling back from UTF-8 to latin-1."""
+    lines_read = 0
 
     try:
         with open(filepath, "r", encoding="utf-8") as f:
@@ -72,37 +69,218 @@ def load_transactions(
             if has_header:
                 next(f, None)
 
-            # Read transactions
             for line in f:
-                # Parse the line
-                items = parse_transaction_line(line)
-
-                # Only add non-empty transactions
-                if items:
-                    transactions.append(items)
-
-                # Check if we've reached max_transactions
-                if (
-                    max_transactions is not None
-                    and len(transactions) >= max_transactions
-                ):
-                    break
+                lines_read += 1
+                yield line
 
     except UnicodeDecodeError:
-        # Try with different encoding if UTF-8 fails
+        # Not valid UTF-8: re-read as latin-1, resuming after the lines
+        # already yielded so no transaction is returned twice
         with open(filepath, "r", encoding="latin-1") as f:
             if has_header:
                 next(f, None)
 
-            for line in f:
-                items = parse_transaction_line(line)
-                if items:
-                    transactions.append(items)
+            yield from itertools.islice(f, lines_read, None)
+
+
+def _parse_lines(lines: Iterable[str]) -> Iterator[List[str]]:
+    """
+    Parse lines into transactions in a single fused pass.
+
+    Same result as parse_transaction_line on each line, but splitting,
+    stripping, lowercasing, filtering, deduplicating and interning happen
+    in one loop per line with no per-line function call. Baskets are
+    short, so this beats the chained C-level calls of the single-line
+    parser when streaming a whole file.
+    """
+    intern = sys.intern
+    for line in lines:
+        items = []
+        seen = set()
+        for item in line.split(","):
+            item = item.strip().lower()
+            if item and item not in seen:
+                seen.add(item)
+                items.append(intern(item))
+
+        # Only yield non-empty transactions
+        if items:
+            yield items
+
+
+def load_transactions(
+    filepath: str,
+    has_header: bool = False,
+    max_transactions: int = None,
+    dedupe: bool = False,
+) -> Union[List[List[str]], List[Tuple[List[str], int]]]:
+    """
+    Load transactions from CSV file.
+
+    Args:
+        filepath: Path to CSV file
+        has_header: Whether first line is a header to skip
+        max_transactions: Maximum number of transactions to load (None = all)
+        dedupe: If True, collapse identical baskets and return
+            (transaction, count) pairs, see count_baskets()
+
+    Returns:
+        List of transactions, where each transaction is a list of items,
+        or (transaction, count) pairs when dedupe is True
+
+    Raises:
+        FileNotFoundError: If file does not exist
+    """
+    transactions = iter_transactions(filepath, has_header)
+
+    # Stop reading once max_transactions have been parsed
+    if max_transactions is not None:
+        transactions = itertools.islice(transactions, max_transactions)
+
+    if dedupe:
+        return count_baskets(transactions)
+    return list(transactions)
+
+
+def count_baskets(
+    transactions: Iterable[List[str]],
+) -> List[Tuple[List[str], int]]:
+    """
+    Collapse identical baskets into (transaction, count) pairs.
+
+    Baskets are identical when they hold the same set of items, in any
+    order. Real basket logs repeat the same small baskets many times, so
+    building a graph from the counted baskets does the pair counting once
+    per distinct basket instead of once per copy.
+
+    Args:
+        transactions: Transactions with items unique within each one, as
+            returned by load_transactions()
+
+    Returns:
+        List of (transaction, count) pairs in first-seen order; each
+        transaction is the first copy seen
+    """
+    counts: Dict[FrozenSet[str], List] = {}
+    for transaction in transactions:
+        key = frozenset(transaction)
+        entry = counts.get(key)
+        if entry is None:
+            counts[key] = [transaction, 1]
+        else:
+            entry[1] += 1
+    return [(transaction, count) for transaction, count in counts.values()]
+
+
+def _csv_engine() -> str:
+    """
+    Pick the pandas CSV parser engine.
+
+    Uses PyArrow's multithreaded reader when pyarrow is installed,
+    otherwise pandas' default C parser.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "c"
+    return "pyarrow"
+
+
+def load_supermarket_data(
+    filepath: str, max_transactions: int = None
+) -> List[List[str]]:
+    """
+    Load the supermarket dataset (one item per row) as transactions.
+
+    Rows are grouped into transactions by (Member_number, Date), in the
+    order each shopping session first appears in the file. A limited load
+    is deterministic: the first max_transactions sessions in file order.
+
+    Format: Member_number,Date,itemDescription
+
+    The parsed file is cached per (filepath, mtime, size), so repeat loads
+    and different limits reuse one parse while an edited file is parsed
+    again. Every call returns new transaction lists.
+
+    Args:
+        filepath: Path to the CSV file
+        max_transactions: Maximum number of transactions to return (None = all)
+
+    Returns:
+        List of transactions (trimmed, lowercase, duplicates removed)
+
+    Raises:
+        FileNotFoundError: If file does not exist
+    """
+    # Check if file exists
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"File not found: {filepath}")
+
+    # The file's mtime and size are part of the cache key, so an edited
+    # file misses the cache instead of returning the previous parse
+    stat = os.stat(filepath)
+    sessions = _read_supermarket_sessions(filepath, stat.st_mtime_ns, stat.st_size)
+
+    # Apply limit if specified
+    if max_transactions:
+        sessions = sessions[:max_transactions]
+
+    # The cached baskets are tuples shared by every caller; hand out lists
+    # the caller owns
+    return [list(basket) for basket in sessions]
+
+
+@functools.lru_cache(maxsize=4)
+def _read_supermarket_sessions(
+    filepath: str, mtime_ns: int, size: int
+) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Parse every shopping session from the supermarket CSV.
+
+    Sessions are scattered through the file, so a session is only complete
+    once the whole file has been read; stopping the read early is not safe.
+
+    Args:
+        filepath: Path to the CSV file
+        mtime_ns: File modification time; only part of the cache key
+        size: File size in bytes; only part of the cache key
+
+    Returns:
+        Tuple of transactions (as tuples) in first-seen order
+
+    Raises:
+        FileNotFoundError: If file does not exist
+    """
+    import pandas as pd
+
+    df = pd.read_csv(
+        filepath,
+        usecols=["Member_number", "Date", "itemDescription"],
+        dtype={
+            "Member_number": "category",
+            "Date": "category",
+            "itemDescription": "category",
+        },
+        engine=_csv_engine(),
+    )
 
-                if (
-                    max_transactions is not None
-                    and len(transactions) >= max_transactions
-                ):
-                    break
+    # Normalize each distinct item name once instead of once per row. Names
+    # are interned so every basket (and later the graph) shares one string
+    # object per unique item; blank names map to None and are dropped.
+    items = df["itemDescription"]
+    names = [
+        sys.intern(str(name).strip().lower()) or None for name in items.cat.categories
+    ]
+    valid_codes = [code for code, name in enumerate(names) if name]
+    df = df[items.cat.codes.isin(valid_codes)]
 
-    return transactions
+    # Group items by (member_number, date) in first-seen order. Group ids
+    # are computed vectorized; a single pass then fills each basket, with
+    # dict keys removing duplicate items within a transaction.
+    grouped = df.groupby(["Member_number", "Date"], sort=False, observed=True)
+    baskets = [{} for _ in range(grouped.ngroups)]
+    for group_id, code in zip(
+        grouped.ngroup().tolist(), df["itemDescription"].cat.codes.tolist()
+    ):
+        baskets[group_id][names[code]] = None
+    return tuple(tuple(basket) for basket in baskets)
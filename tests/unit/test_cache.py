@@ -0,0 +1,204 @@
+"""
+Unit tests for the transaction/graph disk cache.
+"""
+
+import os
+import pytest
+from src.utils import cache
+from src.utils.cache import cache_key, load_or_build
+
+
+def _make_loader(calls):
+    """Loader stub that records each call and parses one basket per line."""
+
+    def loader(filepath, max_transactions=None):
+        calls.append((filepath, max_transactions))
+        with open(filepath) as f:
+            transactions = [line.strip().split(",") for line in f if line.strip()]
+        if max_transactions:
+            transactions = transactions[:max_transactions]
+        return transactions
+
+    return loader
+
+
+class TestCacheKey:
+    """Tests for cache_key function."""
+
+    def test_same_file_same_key(self, tmp_path):
+        """Key is stable for an unchanged file."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("bread,milk\n")
+
+        assert cache_key(str(csv_file)) == cache_key(str(csv_file))
+
+    def test_key_changes_with_limit(self, tmp_path):
+        """Different transaction limits use different keys."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("bread,milk\n")
+
+        assert cache_key(str(csv_file), 10) != cache_key(str(csv_file), 20)
+
+    def test_key_changes_when_file_modified(self, tmp_path):
+        """Editing the file invalidates the key."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("bread,milk\n")
+        before = cache_key(str(csv_file))
+
+        csv_file.write_text("bread,milk,eggs\n")
+
+        assert cache_key(str(csv_file)) != before
+
+    def test_key_changes_with_format_version(self, tmp_path, monkeypatch):
+        """Bumping CACHE_FORMAT_VERSION invalidates existing keys."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("bread,milk\n")
+        before = cache_key(str(csv_file))
+
+        monkeypatch.setattr(
+            cache, "CACHE_FORMAT_VERSION", cache.CACHE_FORMAT_VERSION + 1
+        )
+
+        assert cache_key(str(csv_file)) != before
+
+    def test_missing_file_raises(self, tmp_path):
+        """Missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            cache_key(str(tmp_path / "missing.csv"))
+
+    def test_key_changes_with_loader(self, tmp_path):
+        """Different loaders for the same file use different keys."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("bread,milk\n")
+
+        def other_loader(filepath, max_transactions=None):
+            return []
+
+        assert cache_key(str(csv_file), loader=_make_loader([])) != cache_key(
+            str(csv_file), loader=other_loader
+        )
+
+
+class TestLoadOrBuild:
+    """Tests for load_or_build function."""
+
+    def test_miss_builds_graph(self, tmp_path):
+        """First call loads the data and builds the graph."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("bread,milk\nbread,milk,eggs\n")
+        calls = []
+
+        transactions, graph = load_or_build(
+            str(csv_file), _make_loader(calls), cache_dir=str(tmp_path / "cache")
+        )
+
+        assert len(calls) == 1
+        assert len(transactions) == 2
+        assert graph.get_edge_weight("bread", "milk") == 2
+
+    def test_hit_skips_loader(self, tmp_path):
+        """Second call is served from disk without calling the loader."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("bread,milk\nbread,milk,eggs\n")
+        cache_dir = str(tmp_path / "cache")
+        calls = []
+        loader = _make_loader(calls)
+
+        first = load_or_build(str(csv_file), loader, cache_dir=cache_dir)
+        second = load_or_build(str(csv_file), loader, cache_dir=cache_dir)
+
+        assert len(calls) == 1
+        assert second[0] == first[0]
+        assert second[1].get_all_edges() == first[1].get_all_edges()
+
+    def test_modified_file_rebuilds(self, tmp_path):
+        """Changing the source file triggers a rebuild."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("bread,milk\n")
+        cache_dir = str(tmp_path / "cache")
+        calls = []
+        loader = _make_loader(calls)
+
+        load_or_build(str(csv_file), loader, cache_dir=cache_dir)
+        csv_file.write_text("bread,milk\nbread,butter\n")
+        stat = os.stat(csv_file)
+        os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        _, graph = load_or_build(str(csv_file), loader, cache_dir=cache_dir)
+
+        assert len(calls) == 2
+        assert graph.has_edge("bread", "butter")
+
+    def test_corrupt_entry_rebuilds(self, tmp_path):
+        """A corrupt cache file is ignored and rewritten."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("bread,milk\n")
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        calls = []
+        loader = _make_loader(calls)
+        key = cache_key(str(csv_file), loader=loader)
+        (cache_dir / f"basket-{key}.pkl").write_bytes(b"not a pickle")
+
+        _, graph = load_or_build(str(csv_file), loader, cache_dir=str(cache_dir))
+
+        assert len(calls) == 1
+        assert graph.has_edge("bread", "milk")
+
+    def test_entry_with_missing_module_rebuilds(self, tmp_path):
+        """A pickle referencing a module that no longer exists is rebuilt."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("bread,milk\n")
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        calls = []
+        loader = _make_loader(calls)
+        key = cache_key(str(csv_file), loader=loader)
+        # Protocol 0 GLOBAL opcode: unpickling imports the named module
+        (cache_dir / f"basket-{key}.pkl").write_bytes(b"cmoved_graph_module\nGraph\n.")
+
+        _, graph = load_or_build(str(csv_file), loader, cache_dir=str(cache_dir))
+
+        assert len(calls) == 1
+        assert graph.has_edge("bread", "milk")
+
+    def test_loaders_do_not_share_entries(self, tmp_path):
+        """A different loader for the same file misses the other's entry."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("bread,milk\n")
+        cache_dir = str(tmp_path / "cache")
+
+        def empty_loader(filepath, max_transactions=None):
+            return []
+
+        load_or_build(str(csv_file), _make_loader([]), cache_dir=cache_dir)
+        transactions, graph = load_or_build(
+            str(csv_file), empty_loader, cache_dir=cache_dir
+        )
+
+        assert transactions == []
+        assert graph.node_count() == 0
+
+    def test_no_temporary_files_left(self, tmp_path):
+        """Only the finished pickle remains after a build."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("bread,milk\n")
+        cache_dir = tmp_path / "cache"
+
+        load_or_build(str(csv_file), _make_loader([]), cache_dir=str(cache_dir))
+
+        files = list(cache_dir.iterdir())
+        assert len(files) == 1
+        assert files[0].suffix == ".pkl"
+
+    def test_old_entries_evicted(self, tmp_path, monkeypatch):
+        """Cache keeps at most MAX_CACHE_ENTRIES files."""
+        monkeypatch.setattr(cache, "MAX_CACHE_ENTRIES", 2)
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("bread,milk\nbread,butter\nmilk,eggs\n")
+        cache_dir = tmp_path / "cache"
+        loader = _make_loader([])
+
+        for limit in (1, 2, 3):
+            load_or_build(str(csv_file), loader, limit, cache_dir=str(cache_dir))
+
+        assert len(list(cache_dir.glob("basket-*.pkl"))) == 2
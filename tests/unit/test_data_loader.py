@@ -7,7 +7,14 @@ import pytest
 import tempfile
 import os
 from pathlib import Path
-from src.utils.data_loader import load_transactions, parse_transaction_line
+from src.utils import data_loader
+from src.utils.data_loader import (
+    count_baskets,
+    iter_transactions,
+    load_supermarket_data,
+    load_transactions,
+    parse_transaction_line,
+)
 
 
 class TestParseTransactionLine:
@@ -63,6 +70,14 @@ class TestParseTransactionLine:
 
         assert items == ["bread", "milk", "eggs"]
 
+    def test_items_shared_across_lines(self):
+        """Test the same item parsed from different lines is one object."""
+        first = parse_transaction_line("Bread,milk")
+        second = parse_transaction_line("eggs, BREAD ")
+
+        assert first[0] == second[1] == "bread"
+        assert first[0] is second[1]
+
 
 class TestLoadTransactions:
     """Test loading transactions from CSV files."""
@@ -201,6 +216,193 @@ class TestLoadTransactionsWithSample:
         assert len(transactions) == 2
 
 
+class TestIterTransactions:
+    """Test streaming transactions from a file."""
+
+    def test_yields_same_as_load(self, tmp_path):
+        """Test the iterator yields what load_transactions returns."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("items\nbread,milk\n\nButter, cheese\n")
+
+        iterator = iter_transactions(str(csv_file), has_header=True)
+
+        assert not isinstance(iterator, list)
+        assert list(iterator) == load_transactions(str(csv_file), has_header=True)
+
+    def test_nonexistent_file_raises_immediately(self):
+        """Test missing files raise before iteration starts."""
+        with pytest.raises(FileNotFoundError):
+            iter_transactions("nonexistent_file.csv")
+
+    def test_latin1_fallback_mid_file_no_duplicates(self, tmp_path):
+        """Test a late non-UTF-8 byte does not repeat earlier transactions."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_bytes(b"bread,milk\n" * 2000 + b"caf\xe9,milk\n")
+
+        transactions = load_transactions(str(csv_file))
+
+        assert len(transactions) == 2001
+        assert transactions[-1] == ["caf\u00e9", "milk"]
+
+
+class TestCountBaskets:
+    """Test collapsing identical baskets."""
+
+    def test_identical_baskets_counted(self):
+        """Test baskets with the same items in any order are merged."""
+        transactions = [["bread", "milk"], ["eggs"], ["milk", "bread"]]
+
+        assert count_baskets(transactions) == [
+            (["bread", "milk"], 2),
+            (["eggs"], 1),
+        ]
+
+    def test_load_transactions_dedupe(self, tmp_path):
+        """Test load_transactions(dedupe=True) returns counted baskets."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("bread,milk\nMilk, bread\nbutter\nbread,milk\n")
+
+        result = load_transactions(str(csv_file), dedupe=True)
+
+        assert result == [(["bread", "milk"], 3), (["butter"], 1)]
+
+    def test_dedupe_respects_max_transactions(self, tmp_path):
+        """Test only the first max_transactions rows are counted."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("bread,milk\nbread,milk\nbread,milk\n")
+
+        result = load_transactions(str(csv_file), max_transactions=2, dedupe=True)
+
+        assert result == [(["bread", "milk"], 2)]
+
+
+class TestLoadSupermarketData:
+    """Test loading the one-item-per-row supermarket format."""
+
+    HEADER = "Member_number,Date,itemDescription\n"
+
+    def test_groups_rows_by_member_and_date(self, tmp_path):
+        """Rows with the same member and date form one transaction."""
+        csv_file = tmp_path / "supermarket.csv"
+        csv_file.write_text(
+            self.HEADER
+            + "1,01-01-2015,bread\n"
+            + "2,01-01-2015,milk\n"
+            + "1,01-01-2015,butter\n"
+            + "1,02-01-2015,eggs\n"
+        )
+
+        transactions = load_supermarket_data(str(csv_file))
+
+        assert transactions == [["bread", "butter"], ["milk"], ["eggs"]]
+
+    def test_normalizes_and_deduplicates_items(self, tmp_path):
+        """Items are trimmed, lowercased and deduplicated per transaction."""
+        csv_file = tmp_path / "supermarket.csv"
+        csv_file.write_text(
+            self.HEADER
+            + "1,01-01-2015, Bread \n"
+            + "1,01-01-2015,bread\n"
+            + "1,01-01-2015,MILK\n"
+            + "1,01-01-2015,\n"
+        )
+
+        transactions = load_supermarket_data(str(csv_file))
+
+        assert transactions == [["bread", "milk"]]
+
+    def test_same_item_shares_one_string(self, tmp_path):
+        """Each distinct item is normalized once and shared across baskets."""
+        csv_file = tmp_path / "supermarket.csv"
+        csv_file.write_text(
+            self.HEADER
+            + "1,01-01-2015,Bread\n"
+            + "2,01-01-2015, bread\n"
+            + "3,01-01-2015,   \n"
+        )
+
+        transactions = load_supermarket_data(str(csv_file))
+
+        assert transactions == [["bread"], ["bread"]]
+        assert transactions[0][0] is transactions[1][0]
+
+    def test_max_transactions(self, tmp_path):
+        """Only the first max_transactions sessions are returned."""
+        csv_file = tmp_path / "supermarket.csv"
+        csv_file.write_text(
+            self.HEADER
+            + "1,01-01-2015,bread\n"
+            + "2,01-01-2015,milk\n"
+            + "3,01-01-2015,eggs\n"
+        )
+
+        transactions = load_supermarket_data(str(csv_file), max_transactions=2)
+
+        assert transactions == [["bread"], ["milk"]]
+
+    def test_nonexistent_file(self):
+        """Missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_supermarket_data("nonexistent_supermarket.csv")
+
+    def test_c_engine_fallback(self, tmp_path, monkeypatch):
+        """Without pyarrow, pandas' C parser gives the same transactions."""
+        csv_file = tmp_path / "supermarket.csv"
+        csv_file.write_text(
+            self.HEADER
+            + "1,01-01-2015,bread\n"
+            + "2,01-01-2015,milk\n"
+            + "1,01-01-2015,butter\n"
+        )
+        monkeypatch.setattr(data_loader, "_csv_engine", lambda: "c")
+
+        transactions = load_supermarket_data(str(csv_file))
+
+        assert transactions == [["bread", "butter"], ["milk"]]
+
+    def test_different_limits_parse_file_once(self, tmp_path):
+        """Test that changing max_transactions reuses the parsed file."""
+        csv_file = tmp_path / "supermarket.csv"
+        csv_file.write_text(
+            self.HEADER
+            + "1,01-01-2015,bread\n"
+            + "2,01-01-2015,milk\n"
+            + "3,01-01-2015,eggs\n"
+            + "1,01-01-2015,butter\n"
+        )
+        before = data_loader._read_supermarket_sessions.cache_info().misses
+
+        first = load_supermarket_data(str(csv_file), max_transactions=1)
+        second = load_supermarket_data(str(csv_file), max_transactions=2)
+
+        assert first == [["bread", "butter"]]
+        assert second == [["bread", "butter"], ["milk"]]
+        assert data_loader._read_supermarket_sessions.cache_info().misses == before + 1
+
+    def test_edited_file_is_parsed_again(self, tmp_path):
+        """Test that editing the file invalidates the cached parse."""
+        csv_file = tmp_path / "supermarket.csv"
+        csv_file.write_text(self.HEADER + "1,01-01-2015,bread\n")
+        assert load_supermarket_data(str(csv_file)) == [["bread"]]
+
+        csv_file.write_text(self.HEADER + "1,01-01-2015,milk\n")
+        stat = os.stat(csv_file)
+        os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert load_supermarket_data(str(csv_file)) == [["milk"]]
+
+    def test_returned_transactions_are_not_shared(self, tmp_path):
+        """Test that mutating a result does not change later loads."""
+        csv_file = tmp_path / "supermarket.csv"
+        csv_file.write_text(self.HEADER + "1,01-01-2015,bread\n")
+
+        first = load_supermarket_data(str(csv_file))
+        first[0].append("milk")
+        first.append(["eggs"])
+
+        assert load_supermarket_data(str(csv_file)) == [["bread"]]
+
+
 class TestDataValidation:
     """Test data validation and error handling."""
 
@@ -4,6 +4,7 @@ Following TDD - tests written BEFORE implementation.
 """
 
 import pytest
+from src.analysis import frequent_items
 from src.analysis.frequent_items import (
     find_items_bought_with,
     get_top_associations,
@@ -58,6 +59,25 @@ class TestFindItemsBoughtWith:
         assert result[0] == ("milk", 10)
         assert result[1] == ("butter", 5)
 
+    def test_find_with_negative_limit_slices(self):
+        """Test a negative limit drops items from the end, like list[:limit]."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=10)
+        graph.add_edge("bread", "butter", weight=5)
+        graph.add_edge("bread", "eggs", weight=3)
+        graph.add_edge("bread", "jam", weight=1)
+
+        assert find_items_bought_with(graph, "bread", limit=-1) == [
+            ("milk", 10),
+            ("butter", 5),
+            ("eggs", 3),
+        ]
+        assert find_items_bought_with(graph, "bread", min_frequency=3, limit=-1) == [
+            ("milk", 10),
+            ("butter", 5),
+        ]
+        assert find_items_bought_with(graph, "bread", limit=0) == []
+
     def test_find_isolated_item(self):
         """Test finding items for an isolated node."""
         graph = Graph()
@@ -113,6 +133,17 @@ class TestGetTopAssociations:
 
         assert len(result) == 1
 
+    def test_get_top_associations_negative_n_slices(self):
+        """Test a negative n drops items from the end, like list[:n]."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=10)
+        graph.add_edge("bread", "butter", weight=5)
+        graph.add_edge("bread", "eggs", weight=3)
+
+        result = get_top_associations(graph, "bread", n=-1)
+
+        assert result == [("milk", 10), ("butter", 5)]
+
     def test_get_top_associations_with_depth(self):
         """Test finding associations within certain depth."""
         graph = Graph()
@@ -129,6 +160,26 @@ class TestGetTopAssociations:
         assert "butter" in items
         assert "cheese" not in items
 
+    def test_get_top_associations_deeper_search_scores_direct_only(self):
+        """Test deeper searches still only score direct neighbours."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=10)
+        graph.add_edge("milk", "cheese", weight=8)
+        graph.add_edge("bread", "butter", weight=5)
+
+        expected = [("milk", 10), ("butter", 5)]
+        assert get_top_associations(graph, "bread", n=10, max_depth=2) == expected
+        assert get_top_associations(graph, "bread", n=10, max_depth=None) == expected
+        assert get_top_associations(graph, "bread", n=10, max_depth=0) == []
+
+    def test_get_top_associations_nonexistent_item(self):
+        """Test unknown items raise KeyError."""
+        graph = Graph()
+        graph.add_edge("bread", "milk")
+
+        with pytest.raises(KeyError, match="not found"):
+            get_top_associations(graph, "caviar")
+
 
 class TestGetFrequentPairs:
     """Test finding frequent item pairs."""
@@ -190,6 +241,35 @@ class TestGetFrequentPairs:
 
         assert result == []
 
+    def test_get_pairs_matches_filtered_edges_with_ties(self):
+        """Test ties keep edge order at every threshold."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=3)
+        graph.add_edge("bread", "eggs", weight=5)
+        graph.add_edge("milk", "eggs", weight=3)
+        graph.add_edge("butter", "bread", weight=3)
+        graph.add_edge("butter", "milk", weight=1)
+
+        for min_frequency in (1, 2, 3, 4, 5, 6):
+            expected = sorted(
+                (edge for edge in graph.get_all_edges() if edge[2] >= min_frequency),
+                key=lambda edge: edge[2],
+                reverse=True,
+            )
+            assert get_frequent_pairs(graph, min_frequency) == expected
+
+    def test_get_pairs_does_not_fill_ranking_cache(self):
+        """Test a whole-graph scan leaves per-node rankings uncomputed."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=3)
+        graph.add_edge("milk", "eggs", weight=5)
+        frozen = graph.freeze()
+
+        assert get_frequent_pairs(graph) == [("milk", "eggs", 5), ("bread", "milk", 3)]
+        assert get_frequent_pairs(frozen) == [("milk", "eggs", 5), ("bread", "milk", 3)]
+        assert graph._sorted_neighbors == {}
+        assert frozen._sorted_neighbors == {}
+
 
 class TestGetTopBundles:
     """Test getting top product bundles."""
@@ -208,6 +288,18 @@ class TestGetTopBundles:
         top_bundle = result[0]
         assert top_bundle[2] == 10
 
+    def test_get_top_bundles_negative_n_slices(self):
+        """Test a negative n drops the lightest bundles, like list[:n]."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=10)
+        graph.add_edge("bread", "butter", weight=5)
+        graph.add_edge("milk", "eggs", weight=3)
+
+        result = get_top_bundles(graph, n=-1)
+
+        assert result == [("bread", "milk", 10), ("bread", "butter", 5)]
+        assert get_top_bundles(graph, n=-1) == get_frequent_pairs(graph)[:-1]
+
     def test_get_top_bundles_limit_exceeds(self):
         """Test requesting more bundles than exist."""
         graph = Graph()
@@ -230,6 +322,17 @@ class TestGetTopBundles:
         assert isinstance(item2, str)
         assert isinstance(weight, int)
 
+    def test_top_bundles_match_sorted_pairs_with_ties(self):
+        """Test top bundles equal the head of get_frequent_pairs, ties included."""
+        graph = Graph()
+        graph.add_edge("a", "b", weight=2)
+        graph.add_edge("c", "d", weight=5)
+        graph.add_edge("e", "f", weight=2)
+        graph.add_edge("g", "h", weight=2)
+
+        for n in range(1, 5):
+            assert get_top_bundles(graph, n=n) == get_frequent_pairs(graph)[:n]
+
 
 class TestAssociationQueryIntegration:
     """Integration tests for association queries."""
@@ -284,3 +387,71 @@ class TestAssociationQueryIntegration:
 
         assert len(result) == 1
         assert result[0][0] == "milk"
+
+
+class TestQueryMemoization:
+    """Test repeat queries are cached until the graph changes."""
+
+    def test_repeat_query_served_from_cache(self, monkeypatch):
+        """Test an identical query on an unchanged graph is computed once."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=5)
+        calls = []
+        original = frequent_items._find_items_bought_with
+
+        def counting(*args):
+            calls.append(args)
+            return original(*args)
+
+        monkeypatch.setattr(frequent_items, "_find_items_bought_with", counting)
+        frequent_items._cached_items_bought_with.cache_clear()
+
+        first = find_items_bought_with(graph, "bread", limit=3)
+        second = find_items_bought_with(graph, "bread", limit=3)
+
+        assert first == second == [("milk", 5)]
+        assert len(calls) == 1
+
+    def test_mutation_invalidates_cache(self):
+        """Test adding an edge is visible to the next identical query."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=5)
+        assert find_items_bought_with(graph, "bread") == [("milk", 5)]
+        assert get_top_associations(graph, "bread") == [("milk", 5)]
+
+        graph.add_edge("bread", "butter", weight=9)
+        graph.remove_edge("bread", "milk")
+
+        assert find_items_bought_with(graph, "bread") == [("butter", 9)]
+        assert get_top_associations(graph, "bread") == [("butter", 9)]
+
+    def test_failed_bulk_add_keeps_cache_consistent(self):
+        """Test a rejected batch neither changes the graph nor the answer."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=1)
+        assert find_items_bought_with(graph, "bread") == [("milk", 1)]
+
+        with pytest.raises(ValueError):
+            graph.bulk_add_pairs({("bread", "eggs"): 5, ("eggs", "eggs"): 1})
+
+        assert not graph.has_edge("bread", "eggs")
+        assert find_items_bought_with(graph, "bread") == [("milk", 1)]
+
+    def test_cached_result_is_a_fresh_list(self):
+        """Test mutating a returned list does not corrupt later results."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=5)
+
+        find_items_bought_with(graph, "bread").clear()
+
+        assert find_items_bought_with(graph, "bread") == [("milk", 5)]
+
+    def test_equal_graphs_do_not_share_entries(self):
+        """Test results from one graph are never returned for another."""
+        first = Graph()
+        first.add_edge("bread", "milk", weight=5)
+        second = Graph()
+        second.add_edge("bread", "milk", weight=7)
+
+        assert find_items_bought_with(first, "bread") == [("milk", 5)]
+        assert find_items_bought_with(second, "bread") == [("milk", 7)]
@@ -0,0 +1,128 @@
+"""
+Unit tests for FrozenGraph (read-only CSR snapshot of Graph).
+"""
+
+import pytest
+from src.data_structures.graph import Graph
+
+
+@pytest.fixture
+def graph():
+    """Small mutable graph to freeze."""
+    g = Graph()
+    g.add_edge("bread", "milk", weight=3)
+    g.add_edge("bread", "butter", weight=2)
+    g.add_edge("milk", "eggs", weight=1)
+    g.add_node("salt")
+    return g
+
+
+class TestFreeze:
+    """Test that freezing preserves the graph contents."""
+
+    def test_counts_match(self, graph):
+        """Test node and edge counts are preserved."""
+        frozen = graph.freeze()
+
+        assert frozen.node_count() == graph.node_count()
+        assert frozen.edge_count() == graph.edge_count()
+        assert not frozen.is_empty()
+
+    def test_nodes_and_edges_match(self, graph):
+        """Test nodes and edges come back in the same order."""
+        frozen = graph.freeze()
+
+        assert frozen.get_all_nodes() == graph.get_all_nodes()
+        assert frozen.get_all_edges() == graph.get_all_edges()
+
+    def test_iter_edges_match(self, graph):
+        """Test iter_edges matches the source graph, with and without a filter."""
+        frozen = graph.freeze()
+
+        assert list(frozen.iter_edges()) == list(graph.iter_edges())
+        assert list(frozen.iter_edges(2)) == list(graph.iter_edges(2))
+
+    def test_neighbors_match(self, graph):
+        """Test neighbour dicts, including order, are preserved."""
+        frozen = graph.freeze()
+
+        for item in graph.get_all_nodes():
+            assert list(frozen.get_neighbors(item).items()) == list(
+                graph.get_neighbors(item).items()
+            )
+            assert frozen.degree(item) == graph.degree(item)
+
+    def test_empty_graph(self):
+        """Test freezing an empty graph."""
+        frozen = Graph().freeze()
+
+        assert frozen.is_empty()
+        assert frozen.edge_count() == 0
+
+    def test_freeze_is_a_snapshot(self, graph):
+        """Test later changes to the graph do not affect the snapshot."""
+        frozen = graph.freeze()
+        graph.add_edge("bread", "jam")
+
+        assert not frozen.has_node("jam")
+
+    def test_weights_stored_as_32_bit(self, graph):
+        """Test ordinary weights and node ids use 4-byte arrays."""
+        frozen = graph.freeze()
+
+        assert frozen.weights.itemsize == 4
+        assert frozen.neighbors.itemsize == 4
+
+    def test_weight_beyond_32_bits_preserved(self):
+        """Test a weight too large for 32 bits survives freezing."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=2**40)
+
+        frozen = graph.freeze()
+
+        assert frozen.get_edge_weight("bread", "milk") == 2**40
+
+
+class TestFrozenGraphQueries:
+    """Test read-only queries on a frozen graph."""
+
+    def test_edge_weight_both_directions(self, graph):
+        """Test edge weights are symmetric."""
+        frozen = graph.freeze()
+
+        assert frozen.get_edge_weight("bread", "milk") == 3
+        assert frozen.get_edge_weight("milk", "bread") == 3
+
+    def test_missing_edge(self, graph):
+        """Test missing edges and nodes have weight 0."""
+        frozen = graph.freeze()
+
+        assert not frozen.has_edge("bread", "eggs")
+        assert frozen.get_edge_weight("bread", "eggs") == 0
+        assert frozen.get_edge_weight("bread", "caviar") == 0
+
+    def test_isolated_node(self, graph):
+        """Test an isolated node has no neighbours."""
+        frozen = graph.freeze()
+
+        assert frozen.has_node("salt")
+        assert frozen.get_neighbors("salt") == {}
+        assert frozen.degree("salt") == 0
+
+    def test_nonexistent_node_raises(self, graph):
+        """Test unknown nodes raise KeyError like Graph does."""
+        frozen = graph.freeze()
+
+        with pytest.raises(KeyError, match="not found"):
+            frozen.get_neighbors("caviar")
+        with pytest.raises(KeyError, match="not found"):
+            frozen.degree("caviar")
+
+    def test_sorted_neighbors_match_graph(self, graph):
+        """Test the frozen ranking matches the source graph's."""
+        frozen = graph.freeze()
+
+        for node in graph.get_all_nodes():
+            assert frozen.get_sorted_neighbors(node) == graph.get_sorted_neighbors(node)
+        with pytest.raises(KeyError, match="not found"):
+            frozen.get_sorted_neighbors("caviar")
@@ -102,6 +102,45 @@ class TestAddEdge:
             graph.add_edge("bread", "milk", weight=0)
 
 
+class TestBulkAddPairs:
+    """Test adding many weighted edges at once."""
+
+    def test_bulk_add_creates_symmetric_edges(self):
+        """Test that bulk-added pairs are stored in both directions."""
+        graph = Graph()
+        graph.bulk_add_pairs({("bread", "milk"): 3, ("milk", "eggs"): 1})
+
+        assert graph.node_count() == 3
+        assert graph.edge_count() == 2
+        assert graph.get_edge_weight("milk", "bread") == 3
+        assert graph.get_edge_weight("eggs", "milk") == 1
+
+    def test_bulk_add_accumulates_existing_weight(self):
+        """Test that bulk-added weights add to existing edges."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=2)
+        graph.bulk_add_pairs({("milk", "bread"): 5})
+
+        assert graph.get_edge_weight("bread", "milk") == 7
+        assert graph.get_edge_weight("milk", "bread") == 7
+
+    def test_bulk_add_rejects_self_loop(self):
+        """Test that bulk_add_pairs validates like add_edge."""
+        graph = Graph()
+        with pytest.raises(ValueError, match="Self-loops are not allowed"):
+            graph.bulk_add_pairs({("bread", "bread"): 1})
+
+    def test_bulk_add_invalid_batch_leaves_graph_unchanged(self):
+        """Test that a batch with one bad pair adds none of its pairs."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=2)
+        with pytest.raises(ValueError, match="Self-loops are not allowed"):
+            graph.bulk_add_pairs({("bread", "eggs"): 5, ("milk", "milk"): 1})
+
+        assert not graph.has_node("eggs")
+        assert graph.get_neighbors("bread") == {"milk": 2}
+
+
 class TestGetNeighbors:
     """Test retrieving neighbors of a node."""
 
@@ -142,6 +181,75 @@ class TestGetNeighbors:
         with pytest.raises(KeyError, match="not found in graph"):
             graph.get_neighbors("nonexistent")
 
+    def test_get_neighbors_is_read_only(self):
+        """Test that neighbors cannot be modified through the result."""
+        graph = Graph()
+        graph.add_edge("bread", "milk")
+        
+        neighbors = graph.get_neighbors("bread")
+        with pytest.raises(TypeError):
+            neighbors["eggs"] = 1
+        
+        assert not graph.has_edge("bread", "eggs")
+
+
+class TestGetSortedNeighbors:
+    """Test the cached weight ranking of a node's neighbours."""
+    
+    def test_sorted_by_weight_with_stable_ties(self):
+        """Test neighbours are ranked by weight, ties in insertion order."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=2)
+        graph.add_edge("bread", "eggs", weight=5)
+        graph.add_edge("bread", "butter", weight=2)
+        
+        assert graph.get_sorted_neighbors("bread") == (
+            ("eggs", 5),
+            ("milk", 2),
+            ("butter", 2),
+        )
+    
+    def test_ranking_updates_after_mutation(self):
+        """Test adding or removing an edge invalidates the cached ranking."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=2)
+        graph.add_edge("bread", "eggs", weight=1)
+        assert graph.get_sorted_neighbors("eggs") == (("bread", 1),)
+        assert graph.get_sorted_neighbors("bread")[0] == ("milk", 2)
+        
+        graph.add_edge("bread", "eggs", weight=4)
+        assert graph.get_sorted_neighbors("bread")[0] == ("eggs", 5)
+        assert graph.get_sorted_neighbors("eggs") == (("bread", 5),)
+        
+        graph.remove_edge("bread", "eggs")
+        assert graph.get_sorted_neighbors("bread") == (("milk", 2),)
+        
+        graph.bulk_add_pairs({("milk", "bread"): 1})
+        assert graph.get_sorted_neighbors("bread") == (("milk", 3),)
+        
+        graph.remove_node("milk")
+        assert graph.get_sorted_neighbors("bread") == ()
+    
+    def test_nonexistent_node_raises(self):
+        """Test ranking an unknown item raises KeyError."""
+        graph = Graph()
+        
+        with pytest.raises(KeyError, match="not found"):
+            graph.get_sorted_neighbors("bread")
+    
+    def test_pickle_drops_cached_ranking(self):
+        """Test a pickled graph round-trips and rebuilds its rankings."""
+        import pickle
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=3)
+        graph.get_sorted_neighbors("bread")
+        
+        restored = pickle.loads(pickle.dumps(graph))
+        assert restored._sorted_neighbors == {}
+        
+        restored.add_edge("bread", "eggs", weight=7)
+        assert restored.get_sorted_neighbors("bread")[0] == ("eggs", 7)
+
 
 class TestNodeOperations:
     """Test node-related operations."""
@@ -243,6 +351,27 @@ class TestEdgeOperations:
         assert graph.has_edge("bread", "butter") is True
         assert graph.edge_count() == 1
 
+    def test_iter_edges_matches_get_all_edges(self):
+        """Test iter_edges yields the same edges in the same order."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=3)
+        graph.add_edge("bread", "butter")
+        graph.add_edge("milk", "eggs", weight=2)
+        
+        assert list(graph.iter_edges()) == graph.get_all_edges()
+    
+    def test_iter_edges_min_weight(self):
+        """Test iter_edges skips edges lighter than min_weight."""
+        graph = Graph()
+        graph.add_edge("bread", "milk", weight=3)
+        graph.add_edge("bread", "butter")
+        graph.add_edge("milk", "eggs", weight=2)
+        
+        assert list(graph.iter_edges(min_weight=2)) == [
+            ("bread", "milk", 3),
+            ("milk", "eggs", 2),
+        ]
+
 
 class TestGraphProperties:
     """Test graph property methods."""
@@ -345,3 +474,14 @@ class TestEdgeCases:
         assert graph.node_count() == 2
         assert graph.has_node("Bread")
         assert graph.has_node("bread")
+
+    def test_item_names_are_interned(self):
+        """Test that equal item names built separately share one key object."""
+        import sys
+        graph = Graph()
+        graph.add_edge("".join(["br", "ead"]), "milk")
+        graph.add_edge("".join(["bre", "ad"]), "eggs")
+        
+        (bread,) = [node for node in graph.get_all_nodes() if node == "bread"]
+        assert bread is sys.intern("bread")
+        assert list(graph.get_neighbors("milk"))[0] is bread
@@ -5,6 +5,8 @@ Following TDD - tests written BEFORE implementation.
 
 import pytest
 from src.algorithms.graph_builder import build_graph_from_transactions
+from src.algorithms.search import bfs, dfs
+from src.analysis.frequent_items import find_items_bought_with
 from src.data_structures.graph import Graph
 
 
@@ -201,6 +203,36 @@ class TestGraphBuilderEdgeCases:
         # This assumes data_loader normalizes to lowercase
         assert graph.node_count() == 2
 
+    def test_build_already_normalized_matches_default(self, sample_transactions):
+        """Test the normalized fast path builds the same graph."""
+        default = build_graph_from_transactions(sample_transactions)
+        fast = build_graph_from_transactions(
+            sample_transactions, already_normalized=True
+        )
+
+        assert fast.get_all_nodes() == default.get_all_nodes()
+        assert sorted(fast.get_all_edges()) == sorted(default.get_all_edges())
+
+    def test_build_already_normalized_skips_normalization(self):
+        """Test that already_normalized trusts the caller's item names."""
+        transactions = [["Bread", "milk"]]
+        graph = build_graph_from_transactions(transactions, already_normalized=True)
+
+        assert graph.has_node("Bread")
+        assert not graph.has_node("bread")
+
+    def test_build_weighted_matches_expanded(self):
+        """Test counted baskets build the same graph as repeated ones."""
+        counted = [(["bread", "milk", "eggs"], 3), (["milk"], 2), (["eggs", "jam"], 1)]
+        expanded = [transaction for transaction, count in counted for _ in range(count)]
+
+        weighted = build_graph_from_transactions(counted, weighted=True)
+        default = build_graph_from_transactions(expanded)
+
+        assert weighted.get_all_nodes() == default.get_all_nodes()
+        assert weighted.get_all_edges() == default.get_all_edges()
+        assert weighted.get_edge_weight("bread", "milk") == 3
+
 
 class TestGraphBuilderComplexity:
     """Test algorithm complexity characteristics."""
@@ -266,3 +298,17 @@ class TestGraphBuilderIntegration:
         for i, item1 in enumerate(items):
             for item2 in items[i + 1 :]:
                 assert graph.has_edge(item1, item2)
+
+    def test_build_keeps_basket_order_for_neighbours(self):
+        """Test edges are added in the order items co-occur in each basket."""
+        transactions = [["a", "x"], ["c", "a", "b"]]
+        graph = build_graph_from_transactions(transactions)
+
+        # Neighbour order follows first co-occurrence, not item ids
+        assert list(graph.get_neighbors("b")) == ["c", "a"]
+        assert list(graph.get_neighbors("a")) == ["x", "c", "b"]
+
+        # Traversal and tie order depend on neighbour order
+        assert dfs(graph, "b") == ["b", "c", "a", "x"]
+        assert list(bfs(graph, "b")) == ["b", "c", "a", "x"]
+        assert find_items_bought_with(graph, "b") == [("c", 1), ("a", 1)]
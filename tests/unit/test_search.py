@@ -243,6 +243,27 @@ class TestDFS:
         # But depths might differ based on exploration order
         # This test just ensures both work
 
+    def test_dfs_explores_branch_before_sibling(self):
+        """Test DFS finishes a branch before moving to the next sibling."""
+        graph = Graph()
+        graph.add_edge("a", "b")
+        graph.add_edge("a", "c")
+        graph.add_edge("b", "d")
+        graph.add_edge("c", "e")
+
+        assert dfs(graph, "a") == ["a", "b", "d", "c", "e"]
+
+    def test_dfs_long_chain_no_recursion_limit(self):
+        """Test DFS handles chains longer than the recursion limit."""
+        graph = Graph()
+        for i in range(5000):
+            graph.add_edge(f"item_{i}", f"item_{i + 1}")
+
+        result = dfs(graph, "item_0")
+
+        assert len(result) == 5001
+        assert result[-1] == "item_5000"
+
 
 class TestSearchAlgorithmProperties:
     """Test general properties of search algorithms."""
@@ -284,3 +305,42 @@ class TestSearchAlgorithmProperties:
 
         assert len(bfs_result) == 50
         assert len(dfs_result) == 50
+
+
+class TestSearchOnFrozenGraph:
+    """Test BFS/DFS give the same results on a frozen graph."""
+
+    def _build(self):
+        """Graph with two paths from a to e."""
+        graph = Graph()
+        graph.add_edge("a", "b")
+        graph.add_edge("a", "c")
+        graph.add_edge("b", "d")
+        graph.add_edge("c", "e")
+        graph.add_edge("d", "e")
+        return graph
+
+    def test_bfs_matches_graph(self):
+        """Test frozen BFS returns the same depths in the same order."""
+        graph = self._build()
+        frozen = graph.freeze()
+
+        assert list(bfs(frozen, "a").items()) == list(bfs(graph, "a").items())
+        assert bfs(frozen, "a", max_depth=1) == bfs(graph, "a", max_depth=1)
+
+    def test_dfs_matches_graph(self):
+        """Test frozen DFS visits nodes in the same order."""
+        graph = self._build()
+        frozen = graph.freeze()
+
+        assert dfs(frozen, "a") == dfs(graph, "a")
+        assert dfs(frozen, "a", max_depth=1) == dfs(graph, "a", max_depth=1)
+
+    def test_frozen_nonexistent_start(self):
+        """Test frozen search with non-existent start node."""
+        frozen = self._build().freeze()
+
+        with pytest.raises(KeyError, match="not found"):
+            bfs(frozen, "nonexistent")
+        with pytest.raises(KeyError, match="not found"):
+            dfs(frozen, "nonexistent")
@@ -4,6 +4,7 @@ Unit tests for custom sorting algorithms (TDD).
 
 import pytest
 from src.algorithms.sorting import (
+    bucket_sort,
     merge_sort,
     sort_pairs_by_frequency,
     sort_associations_by_weight,
@@ -71,6 +72,124 @@ class TestMergeSort:
         """Handles negative numbers."""
         assert merge_sort([3, -1, 0, -5, 2]) == [-5, -1, 0, 2, 3]
 
+    def test_stable_for_equal_keys(self):
+        """Equal keys keep their original order in both directions."""
+        items = [("a", 1), ("b", 2), ("c", 1), ("d", 2)]
+        assert merge_sort(items, key=lambda x: x[1]) == [
+            ("a", 1),
+            ("c", 1),
+            ("b", 2),
+            ("d", 2),
+        ]
+        assert merge_sort(items, key=lambda x: x[1], reverse=True) == [
+            ("b", 2),
+            ("d", 2),
+            ("a", 1),
+            ("c", 1),
+        ]
+
+
+class TestMergeSortRuns:
+    """Tests for merge_sort on inputs with existing order."""
+
+    def test_already_sorted(self):
+        """Sorted input comes back unchanged."""
+        items = list(range(200))
+        assert merge_sort(items) == items
+
+    def test_reverse_sorted_input(self):
+        """Strictly descending input is sorted ascending."""
+        items = list(range(200, 0, -1))
+        assert merge_sort(items) == list(range(1, 201))
+
+    def test_descending_input_with_ties_is_stable(self):
+        """Equal keys inside a descending stretch keep their order."""
+        items = [(i // 2, i) for i in range(100, 0, -1)]
+        assert merge_sort(items, key=lambda x: x[0]) == sorted(
+            items, key=lambda x: x[0]
+        )
+
+    def test_large_random_input(self):
+        """Input longer than several runs matches sorted()."""
+        import random
+
+        rng = random.Random(0)
+        items = [rng.randint(0, 50) for _ in range(1000)]
+        assert merge_sort(items) == sorted(items)
+        assert merge_sort(items, reverse=True) == sorted(items, reverse=True)
+
+    def test_stable_without_key_function(self):
+        """Items that compare equal keep their order when no key is given."""
+        import random
+
+        class Weight(int):
+            """An int that remembers its input position."""
+
+        rng = random.Random(2)
+        items = []
+        for position in range(300):
+            item = Weight(rng.randint(0, 20))
+            item.position = position
+            items.append(item)
+
+        for reverse in (False, True):
+            result = merge_sort(items, reverse=reverse)
+            expected = sorted(items, reverse=reverse)
+            assert result == expected
+            assert [x.position for x in result] == [x.position for x in expected]
+
+
+class TestMergeSortKeyCalls:
+    """Tests for how often merge_sort evaluates the key function."""
+
+    def test_key_called_once_per_item(self):
+        """Keys are computed once per item, not on every comparison."""
+        import random
+
+        rng = random.Random(1)
+        items = [rng.randint(0, 1000) for _ in range(500)]
+        calls = []
+
+        def key(x):
+            calls.append(x)
+            return -x
+
+        assert merge_sort(items, key=key) == sorted(items, key=lambda x: -x)
+        assert len(calls) == len(items)
+
+
+class TestBucketSort:
+    """Tests for bucket_sort function."""
+
+    def test_empty_list(self):
+        """Sorting empty list returns empty list."""
+        assert bucket_sort([], key=lambda x: x) == []
+
+    def test_matches_merge_sort(self):
+        """Same result as merge_sort, including the order of equal keys."""
+        items = [("a", 2), ("b", 5), ("c", 2), ("d", 1), ("e", 5)]
+        for reverse in (False, True):
+            assert bucket_sort(
+                items, key=lambda x: x[1], reverse=reverse
+            ) == merge_sort(items, key=lambda x: x[1], reverse=reverse)
+
+    def test_does_not_modify_original(self):
+        """Original list is not modified."""
+        original = [3, 1, 2]
+        bucket_sort(original, key=lambda x: x)
+        assert original == [3, 1, 2]
+
+    def test_single_element_skips_key(self):
+        """A single item comes back in a new list without computing its key."""
+        calls = []
+        original = [("milk", 5)]
+
+        result = bucket_sort(original, key=lambda x: calls.append(x) or x[1])
+
+        assert result == original
+        assert result is not original
+        assert calls == []
+
 
 class TestSortPairsByFrequency:
     """Tests for sort_pairs_by_frequency function."""
@@ -96,6 +215,12 @@ class TestSortPairsByFrequency:
         result = sort_pairs_by_frequency(pairs, reverse=False)
         assert result == [("a", "b", 10), ("e", "f", 25), ("c", "d", 50)]
 
+    def test_ties_keep_input_order(self):
+        """Pairs with equal frequency stay in input order."""
+        pairs = [("a", "b", 5), ("c", "d", 9), ("e", "f", 5), ("g", "h", 9)]
+        result = sort_pairs_by_frequency(pairs)
+        assert result == [("c", "d", 9), ("g", "h", 9), ("a", "b", 5), ("e", "f", 5)]
+
 
 class TestSortAssociationsByWeight:
     """Tests for sort_associations_by_weight function."""
@@ -120,3 +245,9 @@ class TestSortAssociationsByWeight:
         assocs = [("milk", 10), ("bread", 50), ("eggs", 25)]
         result = sort_associations_by_weight(assocs, reverse=False)
         assert result == [("milk", 10), ("eggs", 25), ("bread", 50)]
+
+    def test_ties_keep_input_order(self):
+        """Associations with equal weight stay in input order."""
+        assocs = [("milk", 3), ("bread", 7), ("eggs", 3)]
+        result = sort_associations_by_weight(assocs, reverse=False)
+        assert result == [("milk", 3), ("eggs", 3), ("bread", 7)]